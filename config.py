@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class ModbusConfig:
     """Modbus connection settings."""
     input_ip: str = "172.20.231.25"
@@ -14,7 +14,7 @@ class ModbusConfig:
     retries: int = 0  # Number of retry attempts per operation (0 = fail fast)
 
 
-@dataclass
+@dataclass(frozen=True)
 class SystemConfig:
     """Core system timing and monitoring settings."""
     poll_interval: float = 0.1
@@ -22,6 +22,7 @@ class SystemConfig:
     log_retention_days: int = 7  # Delete old log files after this many days
     comms_timeout: float = 5.0  # Comms failure detection time (how long VERSION=0 before declaring comms failed)
     edge_detection_window_ms: float = 15000.0  # Time window for detecting button presses and signal edges (milliseconds)
+    output_coil_poll_every: int = 10  # Read output coils back every N polls (VERSION is read every poll)
 
 
 @dataclass
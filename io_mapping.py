@@ -4,6 +4,9 @@ This is the single source of truth for all Modbus addresses, labels, and descrip
 When hardware purposes change, only update this file.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
 MODBUS_MAP = {
     'INPUT': {
         'coils': {
@@ -42,6 +45,114 @@ MODBUS_MAP = {
 }
 
 
+def _freeze(obj):
+    """Recursively wrap dicts in read-only MappingProxyType views."""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    return obj
+
+
+# Read-only from here on: every lookup table below is derived from it once
+MODBUS_MAP = _freeze(MODBUS_MAP)
+
+
+def _build_label_index():
+    """Build reverse lookup tables from MODBUS_MAP.
+
+    Returns:
+        tuple: ({(DEVICE, LABEL): (address, reg_type)},
+                {(DEVICE, reg_type, LABEL): address})
+    """
+    label_index = {}
+    typed_index = {}
+    for device, types in MODBUS_MAP.items():
+        # Coils before registers, matching get_address() search order
+        for rtype in ['coils', 'registers']:
+            for addr, info in types.get(rtype, {}).items():
+                label = info['label'].upper()
+                label_index.setdefault((device, label), (addr, rtype))
+                typed_index.setdefault((device, rtype, label), addr)
+    return label_index, typed_index
+
+
+# Built once at import - MODBUS_MAP is static for the life of the process
+_LABEL_INDEX, _TYPED_LABEL_INDEX = _build_label_index()
+
+# (DEVICE, reg_type, address) -> {'label', 'description'}
+_INFO_INDEX = {
+    (device, rtype, addr): info
+    for device, types in MODBUS_MAP.items()
+    for rtype, entries in types.items()
+    for addr, info in entries.items()
+}
+
+
+# Largest hole between two mapped addresses that is still read through in a
+# single request. Reading a few unused addresses is far cheaper than an extra
+# Modbus round-trip.
+MAX_READ_GAP = 8
+
+
+def _address_runs(addresses, max_gap: int = MAX_READ_GAP):
+    """Group addresses into contiguous (start, count) read ranges.
+
+    Args:
+        addresses: Modbus addresses to cover (any order)
+        max_gap: Largest number of unmapped addresses to read through
+
+    Returns:
+        list: (start, count) tuples, one per Modbus request
+
+    Example:
+        >>> _address_runs([0, 1, 2, 3])
+        [(0, 4)]
+        >>> _address_runs([0, 1, 40, 41])
+        [(0, 2), (40, 2)]
+    """
+    runs = []
+    for addr in sorted(addresses):
+        if runs and addr - (runs[-1][0] + runs[-1][1]) <= max_gap:
+            start = runs[-1][0]
+            runs[-1] = (start, addr - start + 1)
+        else:
+            runs.append((addr, 1))
+    return runs
+
+
+def _build_read_plans():
+    """Build bulk-read plans for every (device, reg_type) in MODBUS_MAP.
+
+    Returns:
+        dict: {(DEVICE, reg_type): ((start, count, labels), ...)} where labels
+              is a tuple of length count holding the label at each offset
+              (None for unmapped addresses inside the run)
+    """
+    plans = {}
+    for device, types in MODBUS_MAP.items():
+        for rtype, entries in types.items():
+            plan = []
+            for start, count in _address_runs(entries.keys()):
+                labels = tuple(
+                    entries[addr]['label'] if addr in entries else None
+                    for addr in range(start, start + count)
+                )
+                plan.append((start, count, labels))
+            plans[(device, rtype)] = tuple(plan)
+    return plans
+
+
+_READ_PLANS = _build_read_plans()
+
+# Sorted (address, label, description) tuples per (device, reg_type)
+_ALL_LABELS = {
+    (device, rtype): tuple(sorted(
+        (addr, info['label'], info['description']) for addr, info in entries.items()
+    ))
+    for device, types in MODBUS_MAP.items()
+    for rtype, entries in types.items()
+}
+
+
 def get_address(device: str, label: str, reg_type: str = None):
     """Get Modbus address for a given device and label.
 
@@ -62,23 +173,15 @@ def get_address(device: str, label: str, reg_type: str = None):
     device = device.upper()
     label = label.upper()
 
-    if device not in MODBUS_MAP:
-        return None, None
-
     # Search in specified type only
     if reg_type:
-        for addr, info in MODBUS_MAP[device][reg_type].items():
-            if info['label'].upper() == label:
-                return addr, reg_type
-        return None, None
+        addr = _TYPED_LABEL_INDEX.get((device, reg_type, label))
+        if addr is None:
+            return None, None
+        return addr, reg_type
 
     # Search in both coils and registers
-    for rtype in ['coils', 'registers']:
-        for addr, info in MODBUS_MAP[device].get(rtype, {}).items():
-            if info['label'].upper() == label:
-                return addr, rtype
-
-    return None, None
+    return _LABEL_INDEX.get((device, label), (None, None))
 
 
 def get_info(device: str, address: int, reg_type: str):
@@ -90,14 +193,9 @@ def get_info(device: str, address: int, reg_type: str):
         reg_type: 'coils' or 'registers'
 
     Returns:
-        dict: {'label': str, 'description': str} or None if not found
+        Mapping: read-only {'label': str, 'description': str} or None if not found
     """
-    device = device.upper()
-
-    if device not in MODBUS_MAP:
-        return None
-
-    return MODBUS_MAP[device].get(reg_type, {}).get(address)
+    return _INFO_INDEX.get((device.upper(), reg_type, address))
 
 
 def get_all_labels(device: str, reg_type: str):
@@ -108,15 +206,53 @@ def get_all_labels(device: str, reg_type: str):
         reg_type: 'coils' or 'registers'
 
     Returns:
-        list: List of (address, label, description) tuples
+        tuple: (address, label, description) tuples sorted by address
+               (shared and prebuilt at import - do not mutate)
     """
-    device = device.upper()
+    return _ALL_LABELS.get((device.upper(), reg_type), ())
+
+
+def get_read_plan(device: str, reg_type: str):
+    """Get the precomputed bulk-read plan for a device and type.
 
-    if device not in MODBUS_MAP:
-        return []
+    Args:
+        device: 'INPUT' or 'OUTPUT'
+        reg_type: 'coils' or 'registers'
 
-    result = []
-    for addr, info in MODBUS_MAP[device].get(reg_type, {}).items():
-        result.append((addr, info['label'], info['description']))
+    Returns:
+        tuple: ((start, count, labels), ...) - one entry per Modbus request,
+               empty if nothing is mapped
 
-    return sorted(result, key=lambda x: x[0])  # Sort by address
+    Example:
+        >>> get_read_plan('OUTPUT', 'coils')
+        ((0, 4, ('LED_GREEN', 'MOTOR_2', 'MOTOR_3', 'LED_RED')),)
+    """
+    return _READ_PLANS.get((device.upper(), reg_type), ())
+
+
+@lru_cache(maxsize=None)
+def get_coil_block(device: str, labels: tuple):
+    """Get the start address if labels are one block of consecutive coils.
+
+    Resolved once per (device, labels) and cached - the map is frozen.
+
+    Args:
+        device: 'INPUT' or 'OUTPUT'
+        labels: Tuple of coil labels, in any order
+
+    Returns:
+        int: Lowest address of the block, or None if any label is unmapped or
+             the addresses are not consecutive
+
+    Example:
+        >>> get_coil_block('OUTPUT', ('MOTOR_2', 'MOTOR_3'))
+        1
+    """
+    addresses = [get_address(device, label, 'coils')[0] for label in labels]
+    if not addresses or None in addresses:
+        return None
+    addresses.sort()
+    start = addresses[0]
+    if addresses != list(range(start, start + len(addresses))):
+        return None
+    return start
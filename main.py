@@ -1,7 +1,10 @@
 """Main control logic for Bella Fruita apple sorting machine feeder."""
 
-import argparse
 import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from config import AppConfig
 from src.modbus import create_modbus_client, Procon, MODBUS_MAP, get_all_labels
 from src.logging_system import LogManager
@@ -12,6 +15,10 @@ from src.polling_thread import PollingThread, SystemState
 class ConveyorController:
     """Controller for apple sorting conveyor system."""
 
+    # Reconnect backoff (seconds): doubles after each failed retry_connection()
+    RETRY_BACKOFF_MIN = 1.0
+    RETRY_BACKOFF_MAX = 30.0
+
     def __init__(self, config: AppConfig):
         """Initialize conveyor controller.
 
@@ -45,14 +52,32 @@ class ConveyorController:
         )
         self.comms_dead = False
 
+        # Config is frozen after startup - hoist values read on every poll
+        self._comms_timeout = config.system.comms_timeout
+        self._output_coil_poll_every = config.system.output_coil_poll_every
+
+        # Output coils are only driven by this controller, so they are read
+        # back every N polls; start at N so the first poll reads them
+        self._output_coil_poll_counter = self._output_coil_poll_every
+
+        # Motor coils stopped together by emergency_stop_all_motors()
+        self._motor_labels = ('MOTOR_2', 'MOTOR_3')
+
+        # Reconnect backoff state for retry_connection()
+        self._retry_backoff = self.RETRY_BACKOFF_MIN
+        self._next_retry_at = 0.0
+
+        # Input and output terminals are independent sockets - one worker
+        # lets the output read run while the polling thread reads inputs
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ModbusOutputRead")
+
     def connect(self) -> bool:
         """Connect to both Modbus terminals.
 
         Returns:
             bool: True if both connections successful
         """
-        input_ok = self.input_client.connect()
-        output_ok = self.output_client.connect()
+        input_ok, output_ok = self.connect_clients()
 
         if not input_ok:
             self.log_manager.error("Cannot connect to input terminal")
@@ -64,8 +89,23 @@ class ConveyorController:
 
         return input_ok and output_ok
 
+    def connect_clients(self) -> tuple:
+        """Connect both Modbus clients concurrently.
+
+        A dead terminal can hold connect() for the full timeout; connecting
+        in parallel means that wait is not added on top of the other one.
+
+        Returns:
+            tuple: (input_ok, output_ok)
+        """
+        output_future = self._io_executor.submit(self.output_client.connect)
+        input_ok = self.input_client.connect()
+        output_ok = output_future.result()
+        return input_ok, output_ok
+
     def close(self):
         """Close both Modbus connections."""
+        self._io_executor.shutdown(wait=False)
         self.input_client.close()
         self.output_client.close()
 
@@ -75,30 +115,84 @@ class ConveyorController:
         Returns:
             dict: Dictionary of all input states with labels
         """
-        # Use Procon API to read all input coils and registers - works for both mock and real
-        input_data = {}
-        input_data.update(self.procon.get_all('input', 'coils'))
-        input_data.update(self.procon.get_all('input', 'registers'))
+        input_data = self._read_all_inputs()
 
         # Log the data
         self.log_manager.log_input(input_data)
         return input_data
 
+    def _read_all_inputs(self) -> dict:
+        """Read all inputs (coils + registers) without logging them."""
+        # Use Procon API to read all input coils and registers - works for both mock and real
+        # (coil and register labels are disjoint, so both reads fill the same dict).
+        # A fresh dict each poll: the input log and SystemState keep a reference to it.
+        input_data = self.procon.get_all('input', 'coils')
+        self.procon.get_all('input', 'registers', out=input_data)
+        return input_data
+
     def read_and_log_all_outputs(self) -> dict:
         """Read all outputs (coils + registers) and log them.
 
+        Registers are read every call; coils are read back every
+        output_coil_poll_every calls and otherwise taken from Procon's
+        output shadow.
+
         Returns:
             dict: Dictionary of all output states
         """
-        # Use Procon API to read all output coils and registers
-        output_data = {}
-        output_data.update(self.procon.get_all('output', 'coils'))
-        output_data.update(self.procon.get_all('output', 'registers'))
+        output_data = self._read_all_outputs()
 
         # Log the data
         self.log_manager.log_output(output_data)
         return output_data
 
+    def _read_all_outputs(self) -> dict:
+        """Read all outputs (registers, coils or shadow) without logging them."""
+        # VERSION heartbeat is read every poll. Output coils are read back every
+        # N polls, or every poll while the heartbeat is down so recovery shows
+        # real hardware state; in between, serve what we last wrote.
+        output_data = self.procon.get_all('output', 'registers')
+        self._output_coil_poll_counter += 1
+        if (self._output_coil_poll_counter >= self._output_coil_poll_every
+                or not output_data.get('VERSION')):
+            expected = self.procon.get_output_shadow()
+            self.procon.get_all('output', 'coils', out=output_data)
+            self._output_coil_poll_counter = 0
+            # Audit: hardware should hold exactly what we last wrote
+            drifted = [
+                f"{label}={output_data[label]} (expected {value})"
+                for label, value in expected.items()
+                if label in output_data and output_data[label] != value
+            ]
+            if drifted:
+                self.log_manager.warning("[OUTPUT DRIFT] %s", ", ".join(drifted))
+        else:
+            output_data.update(self.procon.get_output_shadow())
+        return output_data
+
+    def read_and_log_all_io(self) -> tuple:
+        """Read and log inputs and outputs with both terminals in flight at once.
+
+        The output read runs on a worker thread while inputs are read here, so
+        a poll cycle costs max(input, output) round-trip time instead of the sum.
+
+        Both results are logged together once the cycle's reads are done.
+
+        Returns:
+            tuple: (input_data, output_data) dictionaries
+        """
+        output_future = self._io_executor.submit(self._read_all_outputs)
+        try:
+            input_data = self._read_all_inputs()
+        finally:
+            # Always join the output read, even if the input read failed, so a
+            # transaction never spills over into the next poll cycle
+            output_data = output_future.result()
+
+        # Log the data
+        self.log_manager.log_snapshot(input_data, output_data)
+        return input_data, output_data
+
     def check_and_handle_comms_failure(self) -> bool:
         """Check comms health and stop motors if dead.
 
@@ -106,7 +200,7 @@ class ConveyorController:
             bool: True if comms healthy, False if dead
         """
         comms_healthy = self.log_manager.check_comms_health(
-            timeout_seconds=self.config.system.comms_timeout
+            timeout_seconds=self._comms_timeout
         )
 
         if not comms_healthy and not self.comms_dead:
@@ -124,37 +218,60 @@ class ConveyorController:
     def emergency_stop_all_motors(self) -> None:
         """Emergency stop - write False to all output coils."""
         try:
-            # Stop all motors using reliable writes (triple-tap)
-            for motor in ['MOTOR_2', 'MOTOR_3']:
-                self.procon.set_reliable(motor, False)
+            # Stop all motors using reliable writes (triple-tap) - one
+            # write_coils request per tap when the coils are adjacent
+            self.procon.set_reliable_many(self._motor_labels, False)
             self.log_manager.info("All motors stopped")
         except Exception as e:
-            self.log_manager.error(f"Error stopping motors: {e}")
+            self.log_manager.error("Error stopping motors: %s", e)
 
     def retry_connection(self) -> bool:
         """Attempt to reconnect to Modbus terminals.
 
+        Only a client that reports it is disconnected is closed and
+        reconnected; a healthy terminal's socket is left alone. Failed
+        attempts back off exponentially (with jitter) up to RETRY_BACKOFF_MAX;
+        calls made before the next attempt is due return False immediately
+        without touching the network.
+
         Returns:
             bool: True if reconnection successful
         """
+        if time.monotonic() < self._next_retry_at:
+            return False
+
         self.log_manager.debug("Attempting to reconnect...")
 
-        # Close existing connections
+        input_ok = self.input_client.is_connected()
+        output_ok = self.output_client.is_connected()
+
+        # Close only the dead connections
         try:
-            self.input_client.close()
-            self.output_client.close()
+            if not input_ok:
+                self.input_client.close()
+            if not output_ok:
+                self.output_client.close()
         except Exception as e:
-            self.log_manager.error(f"Error closing connections: {e}")
+            self.log_manager.error("Error closing connections: %s", e)
 
-        # Try to reconnect
-        input_ok = self.input_client.connect()
-        output_ok = self.output_client.connect()
+        # Try to reconnect them (both at once if both are down)
+        if not output_ok:
+            output_future = self._io_executor.submit(self.output_client.connect)
+        if not input_ok:
+            input_ok = self.input_client.connect()
+        if not output_ok:
+            output_ok = output_future.result()
 
         if input_ok and output_ok:
             self.log_manager.debug("Reconnection successful")
             self.comms_dead = False
+            self._retry_backoff = self.RETRY_BACKOFF_MIN
+            self._next_retry_at = 0.0
             return True
         else:
+            # Wait 75-100% of the backoff so retries against a dead terminal spread out
+            self._next_retry_at = time.monotonic() + self._retry_backoff * (0.75 + 0.25 * random.random())
+            self._retry_backoff = min(self._retry_backoff * 2, self.RETRY_BACKOFF_MAX)
             if not input_ok:
                 self.log_manager.error("Input terminal connection failed")
             if not output_ok:
@@ -171,7 +288,8 @@ class ConveyorController:
 def main():
     """Main entry point."""
 
-    # Parse command-line arguments
+    # Parse command-line arguments (imported here - only the CLI entry point needs it)
+    import argparse
     parser = argparse.ArgumentParser(
         description='Bella Fruita - Apple Sorting Machine Control System'
     )
@@ -207,7 +325,7 @@ def main():
 
     # Log mode
     mode = "MOCK" if config.use_mock else "LIVE"
-    controller.log_manager.debug(f"Starting in {mode} mode")
+    controller.log_manager.debug("Starting in %s mode", mode)
 
 
     # Create rule engine
@@ -237,11 +355,10 @@ def main():
         if args.view == 'web':
             # Web dashboard mode
             from src.web_server import run_web_dashboard
-            controller.log_manager.info(f"Starting in WEB mode on port {args.port}")
+            controller.log_manager.info("Starting in WEB mode on port %s", args.port)
 
             # Start mock control server if in mock mode
             if config.use_mock:
-                import threading
                 from src.mock_control_server import run_mock_control_server
                 mock_thread = threading.Thread(
                     target=run_mock_control_server,
@@ -257,10 +374,9 @@ def main():
             # Headless logs-only mode
             controller.log_manager.info("Starting in LOGS-ONLY mode (headless)")
             controller.log_manager.info("Press Ctrl+C to stop")
-            # Just keep running until interrupted
-            import time
-            while True:
-                time.sleep(1)
+            # Just keep running until interrupted - block without waking up;
+            # Ctrl+C still raises KeyboardInterrupt out of the wait
+            threading.Event().wait()
 
     except KeyboardInterrupt:
         controller.log_manager.info("Shutting down")
@@ -20,69 +20,174 @@ Order matters - add safety rules LAST to ensure they can override normal operati
 """
 
 from src.rule_engine import Rule
-from threading import Timer
+from datetime import datetime
 import tempfile
 import os
 import time
+import traceback
+
+# Flag file the web server's /tipbins endpoint creates to signal KLAAR_GEWEEG
+# (path built once at import rather than on every scan)
+KLAAR_GEWEEG_FLAG_FILE = os.path.join(tempfile.gettempdir(), 'bellafruita_klaar_geweeg.flag')
 
 
 def clear_klaar_geweeg(mem):
     """Clear KLAAR_GEWEEG flag from memory and delete flag file if exists."""
     mem.set('KLAAR_GEWEEG', False)
-    flag_file = os.path.join(tempfile.gettempdir(), 'bellafruita_klaar_geweeg.flag')
-    if os.path.exists(flag_file):
-        try:
-            os.remove(flag_file)
-        except Exception:
-            pass
+    try:
+        os.remove(KLAAR_GEWEEG_FLAG_FILE)
+    except Exception:
+        pass  # No flag file (or it could not be removed)
+
+
+def stop_motors(procon, motors=None):
+    """Stop conveyor motors (normal stops: move complete, READY, MANUAL).
+
+    Always writes, even if the output shadow says the motors are off: the
+    shadow only records acknowledged writes, so a start that reached the
+    terminal but timed out would otherwise never be stopped. Adjacent motor
+    coils go out as one block write per tap.
+
+    Args:
+        procon: Procon API
+        motors: Motor coil labels to stop (default: both, MOTORS)
+    """
+    procon.set_reliable_many(MOTORS if motors is None else motors, False)
+
+
+def cancel_move_deadlines(mem):
+    """Disarm every pending move timer (like resetting TON timers).
+
+    For aborted moves (MANUAL, ERROR_SAFETY, ERROR_COMMS, ERROR_ESTOP), so no
+    stale deadline is left in mem.
+    """
+    for key in MOVE_DEADLINES:
+        mem.set(key, None)
+
+
+_fromtimestamp = datetime.fromtimestamp
+
+
+def format_clock(timestamp):
+    """Format a time.time() timestamp as HH:MM:SS.mmm for log messages."""
+    return _fromtimestamp(timestamp).strftime('%H:%M:%S.%f')[:-3]
+
+
+# log_once() keys for messages that are cleared again to re-arm them
+LOG_COMMS_RESTORED = 'comms_restored'
+LOG_COMMS_RECONNECTING = 'comms_reconnecting'
+
+# mem keys holding pending move timers (time.time() deadlines) and their delays.
+# Actions arm deadlines from time.time(); conditions compare mem.scan_time.
+MOVE_DEADLINES = (
+    'C3toC2_StartTime', 'C3toC2_Motor3StartTime', 'C3toC2_Delay',
+    'C2toPalm_StopTime',
+    'Motor3_StartTime', 'Motor3_Delay',
+)
+
+# Conveyor motor coils (adjacent outputs - stopped together in one write)
+MOTORS = ('MOTOR_2', 'MOTOR_3')
+MOTOR_2_ONLY = ('MOTOR_2',)
+
+# Bin sensors on C3 and C2 (TRUE = no bin), read together by the move rules
+BIN_SENSORS = ('S1', 'S2')
+
+# BIN_SENSORS values each move rule waits for, matched as one tuple compare
+# (a failed read is None and never matches)
+BINS_ON_C3_ONLY = (False, True)   # Start C3→C2
+BINS_ON_C2_ONLY = (True, False)   # Start C2→PALM, MOVING_BOTH complete
+BINS_ON_BOTH = (False, False)     # Start MOVING_BOTH
+
+# Crate position sensors (TRUE = crate positioned correctly)
+CRATE_SENSORS = ('CPS_1', 'CPS_2')
+
+# Motor/DHLM trip signals (TRUE = OK), debounced before ERROR_SAFETY
+TRIP_INPUTS = ('M1_Trip', 'M2_Trip', 'DHLM_Trip_Signal')
+
+# No VERSION heartbeat for this long means comms have failed
+COMMS_TIMEOUT_S = 10.0
+
+# Comms failure modes (before and after operator acknowledgement)
+COMMS_ERROR_MODES = frozenset({'ERROR_COMMS', 'ERROR_COMMS_ACK'})
+
+# Modes SafetyModeRule may move to READY from - MOVING and other ERROR modes
+# have their own completion or reset rules
+READY_FROM_MODES = frozenset({None, 'MANUAL', 'ERROR_SAFETY'})
+
+# Safety inputs (TRUE = OK) and the violation logged when one is FALSE on a trip
+SAFETY_INPUT_VIOLATIONS = (
+    ('Auto_Select', "Auto_Select=OFF (not in auto mode)"),
+    ('M1_Trip', "M1_Trip=FALSE (Motor 1 tripped)"),
+    ('M2_Trip', "M2_Trip=FALSE (Motor 2 tripped)"),
+    ('DHLM_Trip_Signal', "DHLM_Trip_Signal=FALSE (DHLM tripped)"),
+    ('E_Stop', "E_Stop=FALSE (emergency stop pressed)"),
+)
+
+# Violations implied by the mode the trip happened in
+SAFETY_MODE_VIOLATIONS = {
+    'ERROR_COMMS': "COMMS_FAILED (communications lost)",
+    'ERROR_ESTOP': "E_STOP_TRIGGERED (emergency stop active)",
+}
+
+# Inputs that must all be TRUE (OK) before the system can go READY
+READY_INPUTS = tuple(label for label, _ in SAFETY_INPUT_VIOLATIONS)
 
 
 class CommsHealthCheckRule(Rule):
     """Check comms health and transition to ERROR_COMMS if failed."""
 
-    def __init__(self):
-        super().__init__("Comms Health Monitor")
+    __slots__ = ()
 
-    def condition(self, procon, mem):
-        # Always run this check
-        return True
+    # Always run this check
+    condition = None
+
+    NAME = "Comms Health Monitor"
 
     def action(self, controller, procon, mem):
         """Monitor comms health and set ERROR_COMMS mode if needed."""
-        comms_healthy = controller.log_manager.check_comms_health(timeout_seconds=10.0)
+        comms_healthy = controller.log_manager.check_comms_health(timeout_seconds=COMMS_TIMEOUT_S)
+        # Computed once per scan - later rungs (CommsResetRule) reuse it
+        mem.comms_healthy = comms_healthy
+        mode = mem.mode()
 
-        if not comms_healthy and mem.mode() not in ['ERROR_COMMS', 'ERROR_COMMS_ACK']:
+        if not comms_healthy and mode not in COMMS_ERROR_MODES:
             # Comms have failed - enter ERROR_COMMS mode
-            mem.set_mode('ERROR_COMMS')
+            mode = 'ERROR_COMMS'
+            mem.set_mode(mode)
             controller.log_manager.critical("[ERROR_COMMS] VERSION=0 for 10+ seconds - disconnecting")
             # Stop all motors for safety
             controller.emergency_stop_all_motors()
             # Disconnect
             controller.input_client.close()
             controller.output_client.close()
-        elif comms_healthy and mem.mode() == 'ERROR_COMMS':
+            # Re-arm the restored message for this outage
+            controller.log_manager.clear_logged_once(key=LOG_COMMS_RESTORED)
+            cancel_move_deadlines(mem)
+        elif comms_healthy and mode == 'ERROR_COMMS':
             # Comms have recovered! Wait for operator to acknowledge by flipping to Manual
-            controller.log_manager.info_once("[ERROR_COMMS] Comms restored - flip to Manual to acknowledge")
-            # Clear the reconnection message cache
-            controller.log_manager.clear_logged_once(message="[ERROR_COMMS] Attempting reconnect...")
-        elif mem.mode() == 'ERROR_COMMS':
+            if controller.log_manager.info_once("[ERROR_COMMS] Comms restored - flip to Manual to acknowledge", key=LOG_COMMS_RESTORED):
+                # Clear the reconnection message cache (once, when the restore is first seen)
+                controller.log_manager.clear_logged_once(key=LOG_COMMS_RECONNECTING)
+        elif mode == 'ERROR_COMMS':
             # In error mode and still unhealthy, keep trying to reconnect
-            controller.log_manager.info_once("[ERROR_COMMS] Attempting reconnect...")
+            if controller.log_manager.info_once("[ERROR_COMMS] Attempting reconnect...", key=LOG_COMMS_RECONNECTING):
+                # Comms dropped again before acknowledgement - re-arm the restored message
+                controller.log_manager.clear_logged_once(key=LOG_COMMS_RESTORED)
 
-            # Try to reconnect if not already connected
+            # Try to reconnect if not already connected (retry_connection backs off
+            # between failed attempts, so a dead terminal does not stall every scan)
             try:
-                input_ok = controller.input_client.connect()
-                output_ok = controller.output_client.connect()
-
-                if input_ok and output_ok:
-                    controller.log_manager.debug("Modbus clients reconnected - monitoring for VERSION heartbeat...")
+                if not (controller.input_client.is_connected() and
+                        controller.output_client.is_connected()):
+                    if controller.retry_connection():
+                        controller.log_manager.debug("Modbus clients reconnected - monitoring for VERSION heartbeat...")
             except Exception as e:
                 controller.log_manager.debug(f"Reconnection attempt failed: {e}")
 
-        # Update LED_GREEN based on comms health and mode - only write when state changes
+        # Update LED_GREEN based on comms health and mode
         # LED should be OFF if in error comms modes, ON if comms healthy and in normal mode
-        current_mode = mem.mode()
-        in_error_mode = current_mode in ['ERROR_COMMS', 'ERROR_COMMS_ACK']
+        # (set() skips the bus write while the output shadow already matches)
+        in_error_mode = mode in COMMS_ERROR_MODES
         led_should_be_on = comms_healthy and not in_error_mode
         procon.set('LED_GREEN', led_should_be_on)
 
@@ -90,37 +195,41 @@ class CommsHealthCheckRule(Rule):
 class KlaarGeweegFlagRule(Rule):
     """Check for KLAAR_GEWEEG flag file and set memory if present."""
 
-    def __init__(self):
-        super().__init__("Klaar Geweeg Flag Check")
+    __slots__ = ()
 
-    def condition(self, procon, mem):
-        """Always check for the flag file."""
-        return True
+    # Always check for the flag file
+    condition = None
+
+    NAME = "Klaar Geweeg Flag Check"
 
     def action(self, controller, procon, mem):
         """Check for flag file and set KLAAR_GEWEEG in memory if present."""
-        flag_file = os.path.join(tempfile.gettempdir(), 'bellafruita_klaar_geweeg.flag')
-        if os.path.exists(flag_file):
-            try:
-                # Set in rule engine memory
-                mem.set('KLAAR_GEWEEG', True)
-                # Delete the flag file
-                os.remove(flag_file)
-                controller.log_manager.info("[READY] KLAAR_GEWEEG flag received")
-            except Exception as e:
-                controller.log_manager.error(f"Failed to process KLAAR_GEWEEG flag file: {e}")
-                import traceback
-                controller.log_manager.error(traceback.format_exc())
+        # One syscall per scan: deleting the flag file is also the existence check
+        try:
+            os.remove(KLAAR_GEWEEG_FLAG_FILE)
+        except FileNotFoundError:
+            return  # No flag (the usual case)
+        except Exception as e:
+            controller.log_manager.error(f"Failed to process KLAAR_GEWEEG flag file: {e}")
+            controller.log_manager.error(traceback.format_exc())
+        else:
+            controller.log_manager.info("[READY] KLAAR_GEWEEG flag received")
+        # Set in rule engine memory (also when the file could not be deleted)
+        mem.set('KLAAR_GEWEEG', True)
 
 
 class CommsAcknowledgeRule(Rule):
     """Acknowledge comms error when operator turns Auto_Select OFF (Manual mode)."""
 
-    def __init__(self):
-        super().__init__("Comms Acknowledge")
+    __slots__ = ()
+
+    MODES = frozenset({'ERROR_COMMS'})
+
+    NAME = "Comms Acknowledge"
 
     def condition(self, procon, mem):
-        return mem.mode() == 'ERROR_COMMS' and procon.get('Manual_Select')
+        # Operator switch first - it stays OFF on almost every scan spent in ERROR_COMMS
+        return procon.get('Manual_Select') and mem.mode() == 'ERROR_COMMS'
 
     def action(self, controller, procon, mem):
         """Move to acknowledged state."""
@@ -131,15 +240,24 @@ class CommsAcknowledgeRule(Rule):
 class CommsResetRule(Rule):
     """Reset comms error when operator turns Auto_Select back ON and comms are healthy."""
 
-    def __init__(self):
-        super().__init__("Comms Reset")
+    __slots__ = ()
+
+    MODES = frozenset({'ERROR_COMMS_ACK'})
+
+    NAME = "Comms Reset"
 
     def condition(self, procon, mem):
-        return mem.mode() == 'ERROR_COMMS_ACK' and procon.get('Auto_Select')
+        # Operator switch first - it stays OFF until the operator resets
+        return procon.get('Auto_Select') and mem.mode() == 'ERROR_COMMS_ACK'
 
     def action(self, controller, procon, mem):
         """Clear error and return to READY if comms are healthy, or back to ERROR_COMMS if not."""
-        comms_healthy = controller.log_manager.check_comms_health(timeout_seconds=10.0)
+        # Set by CommsHealthCheckRule earlier in this scan. The engine clears it
+        # at the start of every scan, so if the health rung did not run this
+        # scan it is None - check afresh.
+        comms_healthy = mem.comms_healthy
+        if comms_healthy is None:
+            comms_healthy = controller.log_manager.check_comms_health(timeout_seconds=COMMS_TIMEOUT_S)
 
         if comms_healthy:
             controller.log_manager.info("[READY] Communications restored and reset")
@@ -150,69 +268,14 @@ class CommsResetRule(Rule):
             mem.set_mode('ERROR_COMMS')
 
 
-class ReadyRule(Rule):
-    """Set READY mode when all safety conditions are met."""
-
-    def __init__(self):
-        super().__init__("System Ready Check")
-
-    def condition(self, procon, mem):
-        """Check if all conditions for READY are met.
-
-        Trip signals must be TRUE (OK) for 1+ seconds before allowing READY.
-        """
-        # Immediate checks
-        immediate_ok = (
-            procon.get('Auto_Select') and
-            procon.get('E_Stop')
-        )
-
-        # Trip signals must be held TRUE (OK) for 1+ seconds
-        trips_stable = (
-            procon.get('M1_Trip') and
-            procon.get('M2_Trip') and
-            procon.get('DHLM_Trip_Signal')
-        )
-
-        safety_ok = immediate_ok and trips_stable
-
-        # Only transition to READY from None, OFF, or ERROR_SAFETY states
-        # Don't override MOVING states or other ERROR states (they have explicit reset logic)
-        # ERROR_COMMS, ERROR_COMMS_ACK, ERROR_ESTOP require explicit operator reset
-        current_mode = mem.mode()
-        can_transition = (
-            current_mode is None or
-            current_mode == 'MANUAL' or
-            current_mode == 'ERROR_SAFETY'
-        )
-
-        return safety_ok and can_transition
-
-    def get_conditions(self, procon, mem):
-        current_mode = mem.mode()
-        return {
-            'auto_select': procon.get('Auto_Select'),
-            'e_stop_ok': procon.get('E_Stop'),
-            'm1_trip_ok': procon.get('M1_Trip'),
-            'm2_trip_ok': procon.get('M2_Trip'),
-            'dhlm_trip_ok': procon.get('DHLM_Trip_Signal'),
-            'can_transition': current_mode in (None, 'MANUAL', 'ERROR_SAFETY'),
-            'current_mode': current_mode
-        }
-
-    def action(self, controller, procon, mem):
-        """Set mode to READY."""
-        mem.set_mode('READY')
-        procon.set_reliable('MOTOR_2', False)
-        procon.set_reliable('MOTOR_3', False)
-        controller.log_manager.info("[READY] Motors OFF")
-
-
 class ManualModeRule(Rule):
     """Set mode to MANUAL when manual mode is selected."""
 
-    def __init__(self):
-        super().__init__("Manual Mode")
+    __slots__ = ()
+
+    SKIP_MODES = frozenset({'MANUAL', 'ERROR_COMMS_ACK'})
+
+    NAME = "Manual Mode"
 
     def condition(self, procon, mem):
         """Check if manual mode is selected.
@@ -220,181 +283,175 @@ class ManualModeRule(Rule):
         Note: ERROR_COMMS_ACK is excluded - it should only transition via CommsResetRule.
         """
         return (procon.get('Manual_Select') and
-                mem.mode() != 'MANUAL' and
-                mem.mode() != 'ERROR_COMMS_ACK')
+                mem.mode() not in self.SKIP_MODES)
 
     def action(self, controller, procon, mem):
         """Set mode to MANUAL and stop motors."""
-        procon.set_reliable('MOTOR_2', False)
-        procon.set_reliable('MOTOR_3', False)
+        stop_motors(procon)
+        cancel_move_deadlines(mem)
         clear_klaar_geweeg(mem)
         mem.set_mode('MANUAL')
 
 
-class ClearReadyRule(Rule):
-    """Clear READY state when conditions are no longer met."""
+class SafetyModeRule(Rule):
+    """Move between READY and ERROR_SAFETY from the safety inputs.
+
+    One rung for both directions of the safety state machine:
+    - READY when every safety input is OK and the mode allows it
+    - ERROR_SAFETY when a trip signal has been FALSE for 1+ seconds
+
+    The two never apply in the same scan: READY needs every safety input
+    TRUE, a trip needs a trip signal FALSE.
+    """
+
+    __slots__ = ('_go_ready',)
+
+    NAME = "Safety Mode"
 
     def __init__(self):
-        super().__init__("Clear Ready State")
+        super().__init__()
+        self._go_ready = False
 
-    def condition(self, procon, mem):
+    def _tripped(self, procon, mem):
         """Check if mode should be set to ERROR_SAFETY due to trips.
 
         Uses extended_hold() for trip signals to debounce momentary glitches.
         Trip signals must be FALSE for 1+ seconds before triggering error.
         """
+        # Already in ERROR_SAFETY - skip the input log scans below
+        if mem.mode() == 'ERROR_SAFETY':
+            return False
+
+        # No trip signal FALSE right now (the usual case) - nothing can have been held
+        trips_ok = procon.values(TRIP_INPUTS)
+        if all(trips_ok):
+            return False
+
         # Trip signals with 1-second debounce to filter out blips
-        # Only trigger if they've been FALSE (tripped) for 1+ seconds
-        trip_violations = (
-            procon.extended_hold('M1_Trip', False, 1.0) or
-            procon.extended_hold('M2_Trip', False, 1.0) or
-            procon.extended_hold('DHLM_Trip_Signal', False, 1.0)
-        )
+        # Only trigger if they've been FALSE (tripped) for 1+ seconds - a signal
+        # reading TRUE now cannot have been held FALSE, so only FALSE ones are checked
+        for label, trip_ok in zip(TRIP_INPUTS, trips_ok):
+            if not trip_ok and procon.extended_hold(label, False, 1.0):
+                return True
+        return False
+
+    def condition(self, procon, mem):
+        """Check if either safety transition applies."""
+        # One pass over the safety inputs serves both directions: with every
+        # input OK no trip signal can be FALSE, so the trip check is skipped
+        inputs_ok = procon.all_true(READY_INPUTS)
 
-        return trip_violations and mem.mode() != 'ERROR_SAFETY'
+        # Only transition to READY from None, MANUAL, or ERROR_SAFETY states
+        # Don't override MOVING states or other ERROR states (they have explicit reset logic)
+        # ERROR_COMMS, ERROR_COMMS_ACK, ERROR_ESTOP require explicit operator reset
+        self._go_ready = inputs_ok and mem.mode() in READY_FROM_MODES
+        return self._go_ready or (not inputs_ok and self._tripped(procon, mem))
 
     def get_conditions(self, procon, mem):
+        current_mode = mem.mode()
+        # Same inputs condition() just tested - one read of the image table
+        auto_select, m1_trip, m2_trip, dhlm_trip, e_stop = procon.values(READY_INPUTS)
         return {
+            'auto_select': auto_select,
+            'e_stop_ok': e_stop,
+            'm1_trip_ok': m1_trip,
+            'm2_trip_ok': m2_trip,
+            'dhlm_trip_ok': dhlm_trip,
+            'can_transition': current_mode in READY_FROM_MODES,
             'm1_trip_violated': procon.extended_hold('M1_Trip', False, 1.0),
             'm2_trip_violated': procon.extended_hold('M2_Trip', False, 1.0),
             'dhlm_trip_violated': procon.extended_hold('DHLM_Trip_Signal', False, 1.0),
-            'm1_trip_current': procon.get('M1_Trip'),
-            'm2_trip_current': procon.get('M2_Trip'),
-            'dhlm_trip_current': procon.get('DHLM_Trip_Signal'),
-            'current_mode': mem.mode()
+            'current_mode': current_mode
         }
 
     def action(self, controller, procon, mem):
+        """Set READY, or ERROR_SAFETY and stop motors on a trip."""
+        if self._go_ready:
+            mem.set_mode('READY')
+            stop_motors(procon)
+            # set_mode() has already logged the transition to READY at INFO
+            controller.log_manager.debug("[READY] Motors OFF")
+        else:
+            self._set_error_safety(controller, procon, mem)
+
+    def _set_error_safety(self, controller, procon, mem):
         """Set mode to ERROR_SAFETY and stop motors."""
-        # Identify which specific safety conditions are violated
-        violations = []
+        current_mode = mem.mode()
 
-        # Get current data
-        try:
-            auto_select = procon.get('Auto_Select')
-            m1_trip = procon.get('M1_Trip')
-            m2_trip = procon.get('M2_Trip')
-            dhlm_trip = procon.get('DHLM_Trip_Signal')
-            e_stop = procon.get('E_Stop')
-        except:
-            # Fallback if procon.get fails
-            auto_select = True
-            m1_trip = True
-            m2_trip = True
-            dhlm_trip = True
-            e_stop = True
-
-        if not auto_select:
-            violations.append("Auto_Select=OFF (not in auto mode)")
-        if mem.mode() == 'ERROR_COMMS':
-            violations.append("COMMS_FAILED (communications lost)")
-        if mem.mode() == 'ERROR_ESTOP':
-            violations.append("E_STOP_TRIGGERED (emergency stop active)")
-        if not m1_trip:
-            violations.append("M1_Trip=FALSE (Motor 1 tripped)")
-        if not m2_trip:
-            violations.append("M2_Trip=FALSE (Motor 2 tripped)")
-        if not dhlm_trip:
-            violations.append("DHLM_Trip_Signal=FALSE (DHLM tripped)")
-        if not e_stop:
-            violations.append("E_Stop=FALSE (emergency stop pressed)")
-
-        # Set error state and stop motors
+        # Set error state and stop motors first - the diagnosis below only feeds the log
         mem.set_mode('ERROR_SAFETY')
-        procon.set_reliable('MOTOR_2', False)
-        procon.set_reliable('MOTOR_3', False)
+        procon.set_reliable_many(MOTORS, False)
+        cancel_move_deadlines(mem)
+
+        # Identify which specific safety conditions are violated
+        # (procon.get() returns None on a failed read, which counts as a violation)
+        violations = [message for label, message in SAFETY_INPUT_VIOLATIONS if not procon.get(label)]
+        mode_violation = SAFETY_MODE_VIOLATIONS.get(current_mode)
+        if mode_violation is not None:
+            violations.append(mode_violation)
 
         # Log specific violations
         if violations:
-            violation_msg = ", ".join(violations)
-            controller.log_manager.warning(f"[ERROR_SAFETY] {violation_msg}")
+            controller.log_manager.warning("[ERROR_SAFETY] %s", ", ".join(violations))
         else:
             controller.log_manager.warning("[ERROR_SAFETY] Unknown violation")
 
-class C3ReadyTimerStart(Rule):
-    """Start C3 timer when S1 is broken."""
-    def __init__(self):
-        super().__init__("Start Timer When S1 Is broken")
+class C3ReadyTimer(Rule):
+    """Start the C3 timer when S1 is broken, reset it when S1 is made."""
 
-    def condition(self, procon, mem):
-        """Check if timer should start."""
-        return(
-            not procon.get('S1') and
-            mem.get('C3_Timer') is None and
-            mem.mode() != 'ERROR_ESTOP'  # don't start timer in error mode
-        )
+    __slots__ = ()
 
-    def action(self, controller, procon, mem):
-        mem.set('C3_Timer', time.time())
-        controller.log_manager.debug("[C3] Crate placed - 30s timer started")
-
-class C3ReadyTimerReset(Rule):
-    """Reset C3 timer when S1 is made."""
-    def __init__(self):
-        super().__init__("Reset Timer When S1 Is made")
+    NAME = "C3 Ready Timer"
 
     def condition(self, procon, mem):
-        """Check if timer should reset."""
-        return(
-            procon.get('S1') and
-            mem.get('C3_Timer') is not None
-        )
+        """Check if the timer is out of step with S1."""
+        timer = mem.get('C3_Timer')
+        if procon.get('S1'):
+            # Crate removed - reset a running timer
+            return timer is not None
+        # Crate placed - start the timer, but don't start it in error mode
+        return timer is None and mem.mode() != 'ERROR_ESTOP'
 
     def action(self, controller, procon, mem):
-        mem.set('C3_Timer', None)
-        controller.log_manager.debug("[C3] Crate removed - timer reset")
+        """Start or reset C3_Timer - only reached when it has to change."""
+        if mem.get('C3_Timer') is None:
+            mem.set('C3_Timer', time.time())
+            controller.log_manager.debug("[C3] Crate placed - 30s timer started")
+        else:
+            mem.set('C3_Timer', None)
+            controller.log_manager.debug("[C3] Crate removed - timer reset")
 
-class CratePositionsSensorLedOn(Rule):
-    """Turn on crate position LED when crates aren't positioned correctly."""
-    def __init__(self):
-        super().__init__("Crate Positioning On")
+class CratePositionsLed(Rule):
+    """Red LED on while crates aren't positioned correctly, off once they are."""
 
-    def condition(self, procon, mem):
-        """Check if crates are misaligned."""
-        return(
-            not procon.get('CPS_1') or
-            not procon.get('CPS_2')
-        )
+    __slots__ = ()
 
-    def action(self, controller, procon, mem):
-        """Turn on red LED - only write if not already on."""
-        led_red_on = mem.get('_LED_RED_ON')
-        if not led_red_on:
-            procon.set('LED_RED', True)
-            mem.set('_LED_RED_ON', True)
-
-class CratePositionsSensorLedOff(Rule):
-    """Turn off crate position LED when crates are positioned correctly."""
-    def __init__(self):
-        super().__init__("Crate Positioning Off")
+    # Always drive the LED from the crate sensors
+    condition = None
 
-    def condition(self, procon, mem):
-        """Check if crates are aligned."""
-        return(
-            procon.get('CPS_1') and
-            procon.get('CPS_2')
-        )
+    NAME = "Crate Positioning LED"
 
     def action(self, controller, procon, mem):
-        """Turn off red LED - only write if not already off."""
-        led_red_on = mem.get('_LED_RED_ON')
-        if led_red_on:
-            procon.set('LED_RED', False)
-            mem.set('_LED_RED_ON', False)
+        """Write LED_RED from the crate sensors.
+
+        set() skips the bus write while the output shadow already matches, and
+        coil readback corrects the shadow if the terminal drops the LED.
+        """
+        procon.set('LED_RED', not procon.all_true(CRATE_SENSORS))
 
 class InitiateMoveC3toC2(Rule):
     """Start C3→C2 move: single bin from C3 to C2 after 30s delay."""
 
-    def __init__(self):
-        super().__init__("Initiate Move C3→C2")
+    __slots__ = ()
+
+    MODES = frozenset({'READY'})
+
+    NAME = "Initiate Move C3→C2"
 
     def condition(self, procon, mem):
         """Check if C3→C2 move should start."""
-        return (
-            mem.mode() == 'READY' and
-            procon.get('S2')  and # No bin on C2
-            not procon.get('S1') # Bin present on C3
-        )
+        # READY is checked by the MODES gate - the engine skips this rule in any other mode
+        return procon.values(BIN_SENSORS) == BINS_ON_C3_ONLY  # Bin present on C3, no bin on C2
 
     def get_conditions(self, procon, mem):
         return {
@@ -409,36 +466,35 @@ class InitiateMoveC3toC2(Rule):
 
         # For C3_TO_C2, bin just arrived on C3, so always use full 30 second delay
         remaining_delay = 30.0
-        log_msg = f"[MOVING_C3_TO_C2] Both motors will start in {remaining_delay:.1f}s"
 
         # Store when motors should start (PLC-style timer using timestamp)
-        motors_start_time = time.time() + remaining_delay
+        now = time.time()
+        motors_start_time = now + remaining_delay
         mem.set('C3toC2_StartTime', motors_start_time)
-        from datetime import datetime
-        start_time_str = datetime.fromtimestamp(motors_start_time).strftime('%H:%M:%S.%f')[:-3]
-        current_time_str = datetime.fromtimestamp(time.time()).strftime('%H:%M:%S.%f')[:-3]
-        controller.log_manager.debug(f"Set C3toC2_StartTime to {start_time_str}, current time: {current_time_str}")
+        if controller.log_manager.debug_mode:  # Skip the clock formatting when DEBUG is off
+            controller.log_manager.debug(f"Set C3toC2_StartTime to {format_clock(motors_start_time)}, current time: {format_clock(now)}")
         mem.set('C3toC2_Delay', remaining_delay)  # Store for logging
+        mem.set('C3toC2_Motor3StartTime', None)
 
-        controller.log_manager.info(log_msg)
+        controller.log_manager.info("[MOVING_C3_TO_C2] Both motors will start in %.1fs", remaining_delay)
 
 
 class StartMovingC3toC2AfterDelay(Rule):
     """Start both motors after 30s delay for C3→C2 move."""
 
-    def __init__(self):
-        super().__init__("Start Moving C3→C2 After Delay")
+    __slots__ = ()
+
+    MODES = frozenset({'MOVING_C3_TO_C2'})
+
+    NAME = "Start Moving C3→C2 After Delay"
 
     def condition(self, procon, mem):
         """Check if motors should start after delay."""
         start_time = mem.get('C3toC2_StartTime')
-        current_time = time.time()
-        mode = mem.mode()
-
         return (
-            mode == 'MOVING_C3_TO_C2' and
             start_time is not None and
-            current_time >= start_time
+            mem.scan_time >= start_time and
+            mem.mode() == 'MOVING_C3_TO_C2'
         )
 
     def action(self, controller, procon, mem):
@@ -451,29 +507,57 @@ class StartMovingC3toC2AfterDelay(Rule):
         # Start MOTOR_2 first (reliable write)
         procon.set_reliable('MOTOR_2', True)
 
-        # Safety delay between motors
-        time.sleep(2.0)
+        # Safety delay between motors - MOTOR_3 is started by a later scan
+        # (StartMotor3C3toC2AfterSafetyDelay) so the poll loop never blocks
+        mem.set('C3toC2_Motor3StartTime', time.time() + 2.0)
 
-        # Start MOTOR_3 after delay (reliable write)
-        procon.set_reliable('MOTOR_3', True)
-
-        # Log completion with actual delay value
-        log_msg = f"[MOVING_C3_TO_C2] Motors started after {remaining_delay:.1f}s delay"
-        controller.log_manager.info(log_msg)
+        # Log with actual delay value
+        controller.log_manager.info("[MOVING_C3_TO_C2] MOTOR_2 started after %.1fs delay", remaining_delay)
         mem.set('C3toC2_Delay', None)
 
 
+class StartMotor3C3toC2AfterSafetyDelay(Rule):
+    """Start MOTOR_3 2s after MOTOR_2 for C3→C2 move."""
+
+    __slots__ = ()
+
+    MODES = frozenset({'MOVING_C3_TO_C2'})
+
+    NAME = "Start Motor 3 C3→C2 After Safety Delay"
+
+    def condition(self, procon, mem):
+        """Check if the safety delay after MOTOR_2 has elapsed."""
+        start_time = mem.get('C3toC2_Motor3StartTime')
+        return (
+            start_time is not None and
+            mem.scan_time >= start_time and
+            mem.mode() == 'MOVING_C3_TO_C2'
+        )
+
+    def action(self, controller, procon, mem):
+        # Clear timer to avoid starting again
+        mem.set('C3toC2_Motor3StartTime', None)
+
+        # Start MOTOR_3 (reliable write)
+        procon.set_reliable('MOTOR_3', True)
+        controller.log_manager.info("[MOVING_C3_TO_C2] MOTOR_3 started after 2.0s safety delay")
+
+
 class CompleteMoveC3toC2(Rule):
     """Complete C3→C2 move when bin reaches C2."""
 
-    def __init__(self):
-        super().__init__("Complete Move C3→C2")
+    __slots__ = ()
+
+    MODES = frozenset({'MOVING_C3_TO_C2'})
+
+    NAME = "Complete Move C3→C2"
 
     def condition(self, procon, mem):
         """Check if C3→C2 move is complete."""
+        # Sensor first - it only changes once per move, the mode gate already matched
         return (
-            mem.mode() == 'MOVING_C3_TO_C2' and
-            not procon.get('S2')  # Bin detected on C2
+            not procon.get('S2') and  # Bin detected on C2
+            mem.mode() == 'MOVING_C3_TO_C2'
         )
 
     def get_conditions(self, procon, mem):
@@ -484,10 +568,10 @@ class CompleteMoveC3toC2(Rule):
 
     def action(self, controller, procon, mem):
         """Stop both motors and return to READY."""
-        procon.set_reliable('MOTOR_2', False)
-        procon.set_reliable('MOTOR_3', False)
-        # Clear C3toC2 timer to prevent motors from starting after completion
+        stop_motors(procon)
+        # Clear C3toC2 timers to prevent motors from starting after completion
         mem.set('C3toC2_StartTime', None)
+        mem.set('C3toC2_Motor3StartTime', None)
         mem.set('C3toC2_Delay', None)
         controller.log_manager.info("[MOVING_C3_TO_C2] Completed - both motors stopped")
         mem.set_mode('READY')
@@ -496,22 +580,32 @@ class CompleteMoveC3toC2(Rule):
 class InitiateMoveC2toPalm(Rule):
     """Start C2→PALM move: single bin from C2 to PALM."""
 
+    __slots__ = ('debug',)
+
+    MODES = frozenset({'READY'})
+
+    NAME = "Initiate Move C2→PALM"
+
     def __init__(self, debug=False):
-        super().__init__("Initiate Move C2→PALM")
+        super().__init__()
         self.debug = debug
 
     def condition(self, procon, mem):
         """Check if C2→PALM move should start."""
-        mode_ready = mem.mode() == 'READY'
-        s1 = procon.get('S1')  # No bin on C3
-        s2 = procon.get('S2')  # Bin present on C2 when False
         klaar = mem.get('KLAAR_GEWEEG')
-        palm = procon.extended_hold('PALM_Run_Signal', True, 2.0)  # PALM running for 2+ seconds
+        # Nothing to do until weighing is done - skip the I/O and PALM hold scan
+        if not klaar:
+            return False
+        # READY is checked by the MODES gate - the engine skips this rule in any other mode
+        bins = procon.values(BIN_SENSORS)
+        bins_ok = bins == BINS_ON_C2_ONLY  # No bin on C3, bin present on C2
+        # PALM running for 2+ seconds - only queried once the bins allow the move
+        palm = (bins_ok or self.debug) and procon.extended_hold('PALM_Run_Signal', True, 2.0)
 
-        if self.debug and klaar:
-            print(f"[DEBUG C2→PALM] mode={mem.mode()} S1={s1} S2={s2} KLAAR={klaar} PALM={palm}")
+        if self.debug:
+            print(f"[DEBUG C2→PALM] mode={mem.mode()} S1={bins[0]} S2={bins[1]} KLAAR={klaar} PALM={palm}")
 
-        return mode_ready and s1 and not s2 and klaar and palm
+        return bins_ok and palm
 
     def get_conditions(self, procon, mem):
         return {
@@ -524,25 +618,32 @@ class InitiateMoveC2toPalm(Rule):
 
     def action(self, controller, procon, mem):
         """Start MOTOR_2 and set mode to MOVING_C2_TO_PALM."""
-        if not mem.mode().startswith('ERROR_'):
-            procon.set_reliable('MOTOR_2', True)
-            mem.set_mode('MOVING_C2_TO_PALM')
-            # Reset flag after starting move
-            mem.set('KLAAR_GEWEEG', False)
-            controller.log_manager.info_once("[MOVING_C2_TO_PALM] Started - MOTOR_2 running")
+        # condition() already decided - it only runs in READY (MODES gate), so no
+        # ERROR mode re-check is needed here
+        procon.set_reliable('MOTOR_2', True)
+        mem.set_mode('MOVING_C2_TO_PALM')
+        # Reset flag after starting move
+        mem.set('KLAAR_GEWEEG', False)
+        mem.set('C2toPalm_StopTime', None)
+        controller.log_manager.info("[MOVING_C2_TO_PALM] Started - MOTOR_2 running")
 
 
 class CompleteMoveC2toPalm(Rule):
     """Complete C2→PALM move when bin leaves C2."""
 
-    def __init__(self):
-        super().__init__("Complete Move C2→PALM")
+    __slots__ = ()
+
+    MODES = frozenset({'MOVING_C2_TO_PALM'})
+
+    NAME = "Complete Move C2→PALM"
 
     def condition(self, procon, mem):
         """Check if C2→PALM move is complete."""
+        # Sensor first - it only changes once per move, the mode gate already matched
         return (
-            mem.mode() == 'MOVING_C2_TO_PALM' and
-            procon.get('S2')  # Bin left C2
+            procon.get('S2') and  # Bin left C2
+            mem.get('C2toPalm_StopTime') is None and  # Stop not already pending
+            mem.mode() == 'MOVING_C2_TO_PALM'
         )
 
     def get_conditions(self, procon, mem):
@@ -552,38 +653,66 @@ class CompleteMoveC2toPalm(Rule):
         }
 
     def action(self, controller, procon, mem):
-        """Stop MOTOR_2 and return to READY."""
-        # Delayed stop for MOTOR_2 (1 second)
-        def stop_motor_2():
-            procon.set_reliable('MOTOR_2', False)
-            controller.log_manager.info_once("[MOVING_C2_TO_PALM] Completed - MOTOR_2 stopped")
-            mem.set_mode('READY')
-            # Clear the log_once cache for next cycle
-            controller.log_manager.clear_logged_once(message="[MOVING_C2_TO_PALM] Started - MOTOR_2 running")
-            controller.log_manager.clear_logged_once(message="[MOVING_C2_TO_PALM] MOTOR_2 stopping in 1s")
+        """Schedule the MOTOR_2 stop 1 second from now."""
+        # Delayed stop for MOTOR_2 (PLC-style timer using timestamp)
+        mem.set('C2toPalm_StopTime', time.time() + 1.0)
+        controller.log_manager.info("[MOVING_C2_TO_PALM] MOTOR_2 stopping in 1s")
+
+
+class StopMotor2C2toPalmAfterDelay(Rule):
+    """Stop MOTOR_2 and return to READY once the C2→PALM stop delay elapses."""
+
+    __slots__ = ()
+
+    MODES = frozenset({'MOVING_C2_TO_PALM'})
+
+    NAME = "Stop Motor 2 C2→PALM After Delay"
 
-        Timer(1.0, stop_motor_2).start()
-        controller.log_manager.info_once("[MOVING_C2_TO_PALM] MOTOR_2 stopping in 1s")
+    def condition(self, procon, mem):
+        """Check if the delayed MOTOR_2 stop is due."""
+        stop_time = mem.get('C2toPalm_StopTime')
+        return (
+            stop_time is not None and
+            mem.scan_time >= stop_time and
+            mem.mode() == 'MOVING_C2_TO_PALM'
+        )
+
+    def action(self, controller, procon, mem):
+        """Stop MOTOR_2 and return to READY."""
+        mem.set('C2toPalm_StopTime', None)
+        stop_motors(procon, MOTOR_2_ONLY)
+        controller.log_manager.info("[MOVING_C2_TO_PALM] Completed - MOTOR_2 stopped")
+        mem.set_mode('READY')
 
 class InitiateMoveBoth(Rule):
     """Start moving both bins simultaneously."""
 
+    __slots__ = ('debug',)
+
+    MODES = frozenset({'READY'})
+
+    NAME = "Initiate Move Both"
+
     def __init__(self, debug=False):
-        super().__init__("Initiate Move Both")
+        super().__init__()
         self.debug = debug
 
     def condition(self, procon, mem):
         """Check if both bins move should start."""
-        mode_ready = mem.mode() == 'READY'
-        s1 = procon.get('S1')  # No bin on C3 when True
-        s2 = procon.get('S2')  # No bin on C2 when True
         klaar = mem.get('KLAAR_GEWEEG')
-        palm = procon.extended_hold('PALM_Run_Signal', True, 2.0)  # PALM running for 2+ seconds
+        # Nothing to do until weighing is done - skip the I/O and PALM hold scan
+        if not klaar:
+            return False
+        # READY is checked by the MODES gate - the engine skips this rule in any other mode
+        bins = procon.values(BIN_SENSORS)
+        bins_ok = bins == BINS_ON_BOTH  # Bins on C3 and C2
+        # PALM running for 2+ seconds - only queried once the bins allow the move
+        palm = (bins_ok or self.debug) and procon.extended_hold('PALM_Run_Signal', True, 2.0)
 
-        if self.debug and klaar:
-            print(f"[DEBUG MoveBoth] mode={mem.mode()} S1={s1} S2={s2} KLAAR={klaar} PALM={palm}")
+        if self.debug:
+            print(f"[DEBUG MoveBoth] mode={mem.mode()} S1={bins[0]} S2={bins[1]} KLAAR={klaar} PALM={palm}")
 
-        return mode_ready and not s1 and not s2 and klaar and palm
+        return bins_ok and palm
 
     def get_conditions(self, procon, mem):
         return {
@@ -603,63 +732,58 @@ class InitiateMoveBoth(Rule):
         # Start MOTOR_2 immediately (reliable write)
         procon.set_reliable('MOTOR_2', True)
 
-        # Store when safety delay ends (2 seconds after Motor2 starts)
-        safety_end_time = time.time() + 2.0
-        mem.set('Motor3_SafetyEndTime', safety_end_time)
-
         # Calculate how long bin has been on C3
+        now = time.time()
         c3_timer_start = mem.get('C3_Timer')
         if c3_timer_start:
-            elapsed = time.time() - c3_timer_start
+            elapsed = now - c3_timer_start
             # Ensure bin is on C3 for 30 seconds total
             remaining_delay = max(0, 30.0 - elapsed)
-            log_msg = f"[MOVING_BOTH] MOTOR_2 started, MOTOR_3 in {remaining_delay:.1f}s (bin on C3 for {elapsed:.1f}s)"
         else:
             # Fallback if timer not found (shouldn't happen)
-            elapsed = 0
+            elapsed = None
             remaining_delay = 30.0
             controller.log_manager.warning("[MOVING_BOTH] C3_Timer not found, using 30s default")
-            log_msg = f"[MOVING_BOTH] MOTOR_2 started, MOTOR_3 in {remaining_delay:.1f}s"
-
 
-        # Store when Motor 3 should start (PLC-style timer using timestamp)
-        motor3_start_time = time.time() + remaining_delay
+        # Store when Motor 3 should start (PLC-style timer using timestamp).
+        # Never sooner than the 2 second safety delay after MOTOR_2 starts.
+        motor3_start_time = now + max(remaining_delay, 2.0)
         mem.set('Motor3_StartTime', motor3_start_time)
-        from datetime import datetime
-        start_time_str = datetime.fromtimestamp(motor3_start_time).strftime('%H:%M:%S.%f')[:-3]
-        current_time_str = datetime.fromtimestamp(time.time()).strftime('%H:%M:%S.%f')[:-3]
-        controller.log_manager.debug(f"Set Motor3_StartTime to {start_time_str}, current time: {current_time_str}")
+        if controller.log_manager.debug_mode:  # Skip the clock formatting when DEBUG is off
+            controller.log_manager.debug(f"Set Motor3_StartTime to {format_clock(motor3_start_time)}, current time: {format_clock(now)}")
         mem.set('Motor3_Delay', remaining_delay)  # Store for logging
 
-        controller.log_manager.info_once(log_msg)
+        if elapsed is None:
+            controller.log_manager.info("[MOVING_BOTH] MOTOR_2 started, MOTOR_3 in %.1fs", remaining_delay)
+        else:
+            controller.log_manager.info(
+                "[MOVING_BOTH] MOTOR_2 started, MOTOR_3 in %.1fs (bin on C3 for %.1fs)",
+                remaining_delay, elapsed
+            )
 
 class StartMovingMotor3AfterDelay(Rule):
     """Start Motor 3 after delay."""
 
-    def __init__(self):
-        super().__init__("Start Moving Motor 3 After Delay")
+    __slots__ = ()
+
+    MODES = frozenset({'MOVING_BOTH'})
+
+    NAME = "Start Moving Motor 3 After Delay"
 
     def condition(self, procon, mem):
         """Check if Motor 3 should start after delay."""
         motor3_time = mem.get('Motor3_StartTime')
-        safety_end_time = mem.get('Motor3_SafetyEndTime')
-        current_time = time.time()
-        mode = mem.mode()
-
         return (
-            mode == 'MOVING_BOTH' and
             motor3_time is not None and
-            safety_end_time is not None and
-            current_time >= motor3_time and
-            current_time >= safety_end_time
+            mem.scan_time >= motor3_time and
+            mem.mode() == 'MOVING_BOTH'
         )
 
     def action(self, controller, procon, mem):
         mode = mem.mode()
 
-        # Clear timers to avoid starting again.
+        # Clear timer to avoid starting again.
         mem.set('Motor3_StartTime', None)
-        mem.set('Motor3_SafetyEndTime', None)
 
         # Get the stored delay value
         remaining_delay = mem.get('Motor3_Delay')
@@ -668,22 +792,24 @@ class StartMovingMotor3AfterDelay(Rule):
         procon.set_reliable('MOTOR_3', True)
 
         # Log with actual delay value
-        log_msg = f"[{mode}] MOTOR_3 started after {remaining_delay:.1f}s delay"
-        controller.log_manager.info(log_msg)
+        controller.log_manager.info("[%s] MOTOR_3 started after %.1fs delay", mode, remaining_delay)
         mem.set('Motor3_Delay', None)
 
 class CompleteMoveBoth(Rule):
     """Complete moving both bins with delayed MOTOR_2 stop."""
 
-    def __init__(self):
-        super().__init__("Complete Move Both")
+    __slots__ = ()
+
+    MODES = frozenset({'MOVING_BOTH'})
+
+    NAME = "Complete Move Both"
 
     def condition(self, procon, mem):
         """Check if both bins move is complete."""
+        # Sensors first - they only change once per move, the mode gate already matched
         return (
-            mem.mode() == 'MOVING_BOTH' and
-            procon.get('S1') and      # C3 is empty (no bin)
-            not procon.get('S2')      # C2 has bin (bin present)
+            procon.values(BIN_SENSORS) == BINS_ON_C2_ONLY and  # C3 is empty (no bin), C2 has bin (bin present)
+            mem.mode() == 'MOVING_BOTH'
         )
 
     def get_conditions(self, procon, mem):
@@ -695,11 +821,9 @@ class CompleteMoveBoth(Rule):
 
     def action(self, controller, procon, mem):
         """Stop MOTOR 2 and 3 immediately."""
-        procon.set_reliable('MOTOR_3', False)
-        procon.set_reliable('MOTOR_2', False)
+        stop_motors(procon)
         # Clear Motor3 timer to prevent it from starting after completion
         mem.set('Motor3_StartTime', None)
-        mem.set('Motor3_SafetyEndTime', None)
         mem.set('Motor3_Delay', None)
         controller.log_manager.info("[MOVING_BOTH] Completed - both motors stopped")
         mem.set_mode('READY')
@@ -708,8 +832,12 @@ class CompleteMoveBoth(Rule):
 class EmergencyStopRule(Rule):
     """Emergency stop all motors when E_Stop is pressed and held."""
 
-    def __init__(self):
-        super().__init__("Emergency Stop")
+    __slots__ = ()
+
+    # Already latched - nothing left to stop until EmergencyStopResetRule clears it
+    SKIP_MODES = frozenset({'ERROR_ESTOP'})
+
+    NAME = "Emergency Stop"
 
     def condition(self, procon, mem):
         """Check if emergency stop button is pressed and held for 1 second.
@@ -717,7 +845,8 @@ class EmergencyStopRule(Rule):
         Uses extended_hold to debounce momentary glitches and require
         a sustained E-Stop signal before triggering emergency shutdown.
         """
-        return procon.extended_hold('E_Stop', False, 1.0)
+        # E_Stop released right now (the usual case) means it cannot have been held
+        return not procon.get('E_Stop') and procon.extended_hold('E_Stop', False, 1.0)
 
     def get_conditions(self, procon, mem):
         return {
@@ -727,26 +856,34 @@ class EmergencyStopRule(Rule):
         }
 
     def action(self, controller, procon, mem):
-        if  mem.mode() != 'ERROR_ESTOP': # Avoid duplicate actions and errors.
-            """Stop all motors and set mode to ERROR_ESTOP."""
-            controller.emergency_stop_all_motors()
-            # Clear all memory and set ERROR_ESTOP mode
-            mem.clear()
-            mem.set_mode('ERROR_ESTOP')
-            controller.log_manager.critical("[ERROR_ESTOP] Emergency stop activated")
+        """Stop all motors and set mode to ERROR_ESTOP."""
+        # SKIP_MODES keeps this rung from firing again once ERROR_ESTOP is latched
+        controller.emergency_stop_all_motors()
+        # Reset the move state (pending timers, weigh flag, C3 timer) and set
+        # ERROR_ESTOP mode. Comms health and the LED latches describe the
+        # hardware, not the move, so they are kept.
+        cancel_move_deadlines(mem)
+        mem.set('KLAAR_GEWEEG', False)
+        mem.set('C3_Timer', None)
+        mem.set_mode('ERROR_ESTOP')
+        controller.log_manager.critical("[ERROR_ESTOP] Emergency stop activated")
 
 class EmergencyStopResetRule(Rule):
     """Reset ERROR_ESTOP when operator cycles Auto_Select and E_Stop is released."""
 
-    def __init__(self):
-        super().__init__("Emergency Stop Reset")
+    __slots__ = ()
+
+    MODES = frozenset({'ERROR_ESTOP'})
+
+    NAME = "Emergency Stop Reset"
 
     def condition(self, procon, mem):
         """Check if reset triggered (Auto_Select switched to manual) and E_Stop released."""
+        # Reset switch first - it is the operator's last step, so it is OFF on most scans
         return (
-            mem.mode() == 'ERROR_ESTOP' and
+            procon.get('Manual_Select') and  # Detect switch to manual (reset position)
             procon.get('E_Stop') and  # E_Stop must be released
-            procon.get('Manual_Select')  # Detect switch to manual (reset position)
+            mem.mode() == 'ERROR_ESTOP'
         )
 
     def action(self, controller, procon, mem):
@@ -760,11 +897,13 @@ def setup_rules(rule_engine, debug=False):
     """Add all rules to the rule engine.
 
     LADDER LOGIC ORDER (like PLC rungs):
-    1. Test/Debug rules (edge detection tests)
+    1. KLAAR_GEWEEG flag file check
     2. Comms monitoring and reset logic
-    3. System ready checks and OPERATION_MODE management
-    4. Normal operation (state machine transitions)
-    5. EMERGENCY OVERRIDES (E-Stop, comms failure) - ALWAYS LAST
+    3. System ready checks and operation mode management
+    4. Normal operation (timers, LED, state machine transitions)
+    5. EMERGENCY OVERRIDES (E-Stop) - ALWAYS LAST
+
+    This is the only rule set - rules.py defines each rule and setup_rules() once.
 
     Args:
         rule_engine: RuleEngine instance
@@ -779,28 +918,27 @@ def setup_rules(rule_engine, debug=False):
     rule_engine.add_rule(CommsResetRule())             # Reset after acknowledgment (switch ON)
 
     # =====  System Ready State Management =====
-    rule_engine.add_rule(ManualModeRule())             # Set mode='OFF' when manual selected
-    rule_engine.add_rule(ReadyRule())                  # Set mode='READY' when conditions met
-    rule_engine.add_rule(ClearReadyRule())             # Set mode='ERROR_SAFETY' when trips occur
+    rule_engine.add_rule(ManualModeRule())             # Set mode='MANUAL' when manual selected
+    rule_engine.add_rule(SafetyModeRule())             # mode='READY' when safe, 'ERROR_SAFETY' on trips
 
     # =====  C3 Timer Rules=====
-    rule_engine.add_rule(C3ReadyTimerStart())
-    rule_engine.add_rule(C3ReadyTimerReset())
+    rule_engine.add_rule(C3ReadyTimer())               # Start/reset C3_Timer from S1
 
     # =====  Creat Possitioning Rules=====
     # C3→C2 operation (single bin from C3 to C2)
-    rule_engine.add_rule(CratePositionsSensorLedOn())
-    rule_engine.add_rule(CratePositionsSensorLedOff())
+    rule_engine.add_rule(CratePositionsLed())
 
     # =====  State Machine Operations =====
     # C3→C2 operation (single bin from C3 to C2)
     rule_engine.add_rule(InitiateMoveC3toC2())         # Start C3→C2 move with 30s delay
-    rule_engine.add_rule(StartMovingC3toC2AfterDelay()) # Start both motors after 30s delay
+    rule_engine.add_rule(StartMovingC3toC2AfterDelay()) # Start MOTOR_2 after 30s delay
+    rule_engine.add_rule(StartMotor3C3toC2AfterSafetyDelay()) # Start MOTOR_3 2s after MOTOR_2
     rule_engine.add_rule(CompleteMoveC3toC2())         # Complete when S2 becomes true
 
     # C2→PALM operation (single bin from C2 to PALM)
     rule_engine.add_rule(InitiateMoveC2toPalm(debug=debug))       # Start C2→PALM move on button
-    rule_engine.add_rule(CompleteMoveC2toPalm())       # Complete when S2 becomes false
+    rule_engine.add_rule(CompleteMoveC2toPalm())       # Start 1s stop delay when S2 becomes true
+    rule_engine.add_rule(StopMotor2C2toPalmAfterDelay()) # Stop MOTOR_2 when delay elapses
 
     # Both bins operation (C3→C2 and C2→PALM simultaneously)
     rule_engine.add_rule(InitiateMoveBoth(debug=debug))           # Start both bins move on button
@@ -809,5 +947,5 @@ def setup_rules(rule_engine, debug=False):
 
     # =====  EMERGENCY OVERRIDES (ALWAYS EXECUTE LAST) =====
     # These rules execute last and can override all previous rules
-    rule_engine.add_rule(EmergencyStopRule())          # E-Stop stops everything, sets OPERATION_MODE='ERROR'
+    rule_engine.add_rule(EmergencyStopRule())          # E-Stop stops everything, sets mode='ERROR_ESTOP'
     rule_engine.add_rule(EmergencyStopResetRule())     # Allow reset after emergency
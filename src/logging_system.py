@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from collections import deque
+from itertools import islice
 from typing import Dict, Any, List, Optional
 import time
 import json
@@ -57,6 +58,7 @@ class LogManager:
         self.input_logs: deque[LogEntry] = deque(maxlen=max_entries)
         self.output_logs: deque[LogEntry] = deque(maxlen=max_entries)
         self.event_logs: deque[EventEntry] = deque(maxlen=max_entries)
+        self._last_heartbeat_time: float = 0.0  # Last output log with VERSION != 0
         self._logged_once: set[str] = set()  # Track messages logged once
         self.debug_mode = debug_mode
         self._last_cleanup_time: float = 0.0
@@ -98,41 +100,57 @@ class LogManager:
         Args:
             data: Dictionary of output values (e.g., {'M1': True, 'REG0': 12345, ...})
         """
-        entry = LogEntry(
-            timestamp=time.time(),
-            device_id="OUTPUT",
-            data=data
-        )
-        self.output_logs.append(entry)
+        self._append_output(time.time(), data)
+
+    def log_snapshot(self, input_data: Dict[str, Any], output_data: Dict[str, Any]) -> None:
+        """Log one poll cycle's input and output reads together.
+
+        Both entries share a single timestamp, taken once.
+
+        Args:
+            input_data: Dictionary of input values
+            output_data: Dictionary of output values
+        """
+        timestamp = time.time()
+        self.input_logs.append(LogEntry(timestamp=timestamp, device_id="INPUT", data=input_data))
+        self._append_output(timestamp, output_data)
+
+    def _append_output(self, timestamp: float, data: Dict[str, Any]) -> None:
+        """Append an output log entry and track the VERSION heartbeat."""
+        self.output_logs.append(LogEntry(timestamp=timestamp, device_id="OUTPUT", data=data))
+        # Track the heartbeat here so check_comms_health() never scans the stack
+        if data.get('VERSION', 0) != 0:
+            self._last_heartbeat_time = timestamp
 
     def get_recent_input_logs(self, count: int = 10) -> List[LogEntry]:
         """Get most recent input logs."""
-        return list(self.input_logs)[-count:] if self.input_logs else []
+        return self._tail(self.input_logs, count)
 
     def get_recent_output_logs(self, count: int = 10) -> List[LogEntry]:
         """Get most recent output logs."""
-        return list(self.output_logs)[-count:] if self.output_logs else []
+        return self._tail(self.output_logs, count)
+
+    @staticmethod
+    def _tail(logs: deque, count: int) -> list:
+        """Copy only the last `count` entries of a log deque (not the whole stack)."""
+        return list(islice(logs, max(0, len(logs) - count), None))
 
     def check_comms_health(self, timeout_seconds: float = 5.0) -> bool:
-        """Check if communications are healthy based on recent logs."""
+        """Check if communications are healthy based on recent logs.
+
+        Healthy means an output log arrived within the timeout and at least
+        one output log in that window had a non-zero VERSION heartbeat.
+        """
         if not self.output_logs:
             return True  # No logs yet - assume healthy on startup
 
-        current_time = time.time()
-        cutoff_time = current_time - timeout_seconds
+        cutoff_time = time.time() - timeout_seconds
 
         last_log_time = self.output_logs[-1].timestamp
         if last_log_time < cutoff_time:
             return False
 
-        for entry in reversed(self.output_logs):
-            if entry.timestamp < cutoff_time:
-                break
-            version_value = entry.data.get('VERSION', 0)
-            if version_value != 0:
-                return True
-
-        return False
+        return self._last_heartbeat_time >= cutoff_time
 
     def get_last_input_timestamp(self) -> float:
         """Get timestamp of last input log."""
@@ -142,44 +160,54 @@ class LogManager:
         """Get timestamp of last output log."""
         return self.output_logs[-1].timestamp if self.output_logs else 0
 
-    def log_event(self, level: str, message: str, **context) -> None:
-        """Log a system event with optional context."""
+    def log_event(self, level: str, message: str, *args, **context) -> None:
+        """Log a system event with optional context.
+
+        Args:
+            level: Log level name (e.g., 'INFO', 'DEBUG')
+            message: Message, or a %-style format string when args are given
+            *args: Format arguments - applied only if the entry is kept
+            **context: Additional context written alongside DEBUG entries
+        """
+        level = level.upper()
+        # Skip DEBUG entirely unless debug_mode is enabled (UI never sees DEBUG)
+        if level == "DEBUG" and not self.debug_mode:
+            return
+        if args:
+            message = message % args
         entry = EventEntry(
             timestamp=time.time(),
-            level=level.upper(),
+            level=level,
             message=message,
             context=context if context else None
         )
         # Only add to in-memory logs if not DEBUG (UI never sees DEBUG)
         if entry.level != "DEBUG":
             self.event_logs.append(entry)
-        # Skip DEBUG file writes unless debug_mode is enabled
-        if entry.level == "DEBUG" and not self.debug_mode:
-            return
         with self._buffer_lock:
             self._log_buffer.append(entry)
             if len(self._log_buffer) >= self._flush_threshold:
                 self._write_buffer_to_file()
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args) -> None:
         """Log an info event."""
-        self.log_event("INFO", message)
+        self.log_event("INFO", message, *args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """Log a warning event."""
-        self.log_event("WARNING", message)
+        self.log_event("WARNING", message, *args)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
         """Log an error event."""
-        self.log_event("ERROR", message)
+        self.log_event("ERROR", message, *args)
 
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args) -> None:
         """Log a critical event."""
-        self.log_event("CRITICAL", message)
+        self.log_event("CRITICAL", message, *args)
 
-    def debug(self, message: str, **context) -> None:
+    def debug(self, message: str, *args, **context) -> None:
         """Log a debug event - always writes to file, never shown in UI."""
-        self.log_event("DEBUG", message, **context)
+        self.log_event("DEBUG", message, *args, **context)
 
     def debug_rule(self, rule_name: str, conditions: Dict[str, Any]) -> None:
         """Log DEBUG when a rule condition is met - file only.
@@ -203,66 +231,93 @@ class LogManager:
         """
         if not hasattr(self, '_prev_io'):
             self._prev_io = {}
-        
-        changes = {}
-        for key, value in current_io.items():
-            if key not in self._prev_io or self._prev_io[key] != value:
-                changes[key] = {'from': self._prev_io.get(key), 'to': value}
-        
-        if changes:
-            # Build readable message: "I/O: S1=False, MOTOR_2=True"
-            change_strs = [f"{k}={v['to']}" for k, v in changes.items()]
-            msg = f"I/O: {', '.join(change_strs)}"
-            self.debug(msg, changes=changes)
-        
+
+        # The change list only feeds DEBUG entries - skip the diff when they are
+        # dropped, but keep the baseline current for when DEBUG is turned on
+        if self.debug_mode:
+            changes = {}
+            for key, value in current_io.items():
+                if key not in self._prev_io or self._prev_io[key] != value:
+                    changes[key] = {'from': self._prev_io.get(key), 'to': value}
+
+            if changes:
+                # Build readable message: "I/O: S1=False, MOTOR_2=True"
+                change_strs = [f"{k}={v['to']}" for k, v in changes.items()]
+                msg = f"I/O: {', '.join(change_strs)}"
+                self.debug(msg, changes=changes)
+
         self._prev_io = current_io.copy()
 
     def log_mem_changes(self, current_mem: Dict[str, Any]) -> None:
         """Log DEBUG for any memory values that changed since last call.
         
+        Keeps a reference to current_mem for the next diff, so pass a fresh
+        copy (RuleEngine.get_state()) that is not modified afterwards.
+
         Args:
             current_mem: Current memory state dict
         """
         if not hasattr(self, '_prev_mem'):
             self._prev_mem = {}
-        
-        changes = {}
-        for key, value in current_mem.items():
-            if key not in self._prev_mem or self._prev_mem[key] != value:
-                changes[key] = {'from': self._prev_mem.get(key), 'to': value}
-        
-        if changes:
-            # Build readable message: "MEM: _MODE=MOVING, C3_Timer=12345"
-            change_strs = [f"{k}={v['to']}" for k, v in changes.items()]
-            msg = f"MEM: {', '.join(change_strs)}"
-            self.debug(msg, changes=changes)
-        
-        self._prev_mem = current_mem.copy()
 
-    def log_once(self, level: str, message: str) -> bool:
-        """Log a message only once, preventing duplicates."""
-        message_key = f"{level}:{message}"
+        # As log_io_changes(): only diff when the DEBUG entries are kept
+        if self.debug_mode:
+            changes = {}
+            for key, value in current_mem.items():
+                if key not in self._prev_mem or self._prev_mem[key] != value:
+                    changes[key] = {'from': self._prev_mem.get(key), 'to': value}
+
+            if changes:
+                # Build readable message: "MEM: _MODE=MOVING, C3_Timer=12345"
+                change_strs = [f"{k}={v['to']}" for k, v in changes.items()]
+                msg = f"MEM: {', '.join(change_strs)}"
+                self.debug(msg, changes=changes)
+
+        self._prev_mem = current_mem
+
+    def log_once(self, level: str, message: str, *args, key: Optional[str] = None) -> bool:
+        """Log a message only once, preventing duplicates.
+
+        Args:
+            level: Log level name
+            message: Message to log, or a %-style format string when args are given
+            *args: Format arguments - applied only when the message is logged
+            key: Optional symbolic ID to dedupe on instead of level and message.
+                 Callers on a hot path should pass a module-level constant -
+                 no key string is built per call, and rewording the message
+                 cannot break clear_logged_once(key=...).
+
+        Returns:
+            True if the message was logged, False if it was already logged
+        """
+        message_key = key if key is not None else f"{level}:{message}"
         if message_key not in self._logged_once:
             self._logged_once.add(message_key)
-            self.log_event(level, message)
+            self.log_event(level, message, *args)
             return True
         return False
 
-    def info_once(self, message: str) -> bool:
-        return self.log_once("INFO", message)
+    def info_once(self, message: str, *args, key: Optional[str] = None) -> bool:
+        return self.log_once("INFO", message, *args, key=key)
 
-    def warning_once(self, message: str) -> bool:
-        return self.log_once("WARNING", message)
+    def warning_once(self, message: str, *args, key: Optional[str] = None) -> bool:
+        return self.log_once("WARNING", message, *args, key=key)
 
-    def error_once(self, message: str) -> bool:
-        return self.log_once("ERROR", message)
+    def error_once(self, message: str, *args, key: Optional[str] = None) -> bool:
+        return self.log_once("ERROR", message, *args, key=key)
 
-    def critical_once(self, message: str) -> bool:
-        return self.log_once("CRITICAL", message)
+    def critical_once(self, message: str, *args, key: Optional[str] = None) -> bool:
+        return self.log_once("CRITICAL", message, *args, key=key)
 
-    def clear_logged_once(self, message: str = None, level: str = None) -> None:
-        """Clear logged once cache to allow messages to be logged again."""
-        if message is None and level is None:
+    def clear_logged_once(self, message: str = None, level: str = None, key: str = None) -> None:
+        """Clear logged once cache to allow messages to be logged again.
+
+        Pass key to clear a message logged with that key; message/level clear
+        messages logged without one. No arguments clears everything.
+        """
+        if key is not None:
+            self._logged_once.discard(key)
+        elif message is None and level is None:
             self._logged_once.clear()
         elif message and level:
             self._logged_once.discard(f"{level}:{message}")
@@ -287,10 +342,15 @@ class LogManager:
         Note: DEBUG events are not stored in memory (file-only), so include_debug
               only affects future implementations if DEBUG storage changes.
         """
-        events = list(self.event_logs)
-        if not include_debug:
-            events = [e for e in events if e.level != "DEBUG"]
-        return events[-count:] if events else []
+        if include_debug:
+            return self._tail(self.event_logs, count)
+        # Walk back from the newest entry and stop once count are collected
+        events = list(islice(
+            (e for e in reversed(self.event_logs) if e.level != "DEBUG"),
+            max(0, count)
+        ))
+        events.reverse()
+        return events
 
     def _retention_cutoff(self) -> float:
         """Return the oldest timestamp we want to keep."""
@@ -410,11 +470,11 @@ class LogManager:
         now = time.time()
         should_cleanup_files = (now - self._last_cleanup_time) >= 86400
 
-        # Trim in-memory deque — rebuild without old entries
-        fresh = [e for e in self.event_logs if e.timestamp >= cutoff]
-        if len(fresh) < len(self.event_logs):
-            self.event_logs.clear()
-            self.event_logs.extend(fresh)
+        # Trim in-memory deque — entries are appended oldest first, so
+        # expired ones sit at the left end
+        event_logs = self.event_logs
+        while event_logs and event_logs[0].timestamp < cutoff:
+            event_logs.popleft()
 
         if not self.log_file.exists():
             if should_cleanup_files:
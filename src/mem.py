@@ -3,6 +3,7 @@
 Provides a clean API for accessing machine operation mode and other internal state.
 """
 
+import sys
 from typing import Optional, Any
 
 
@@ -23,6 +24,9 @@ class MachineMemory:
         1234567890.5
     """
 
+    # Read by nearly every rung of every scan - no per-instance __dict__
+    __slots__ = ('_state', '_logger', 'scan_time', 'comms_healthy')
+
     def __init__(self, logger: Optional[Any] = None):
         """Initialize empty machine memory.
 
@@ -32,6 +36,16 @@ class MachineMemory:
         self._state = {}
         self._logger = logger
 
+        # time.time() sampled once at the start of the current scan by the rule
+        # engine. Kept out of _state so it is not reported as a memory change.
+        self.scan_time = 0.0
+
+        # Comms health computed by CommsHealthCheckRule for later rungs of the
+        # same scan (None = not computed yet; reset by the engine each scan).
+        # Per-scan scratch, so also kept out of _state - it is not machine
+        # state for the UI or the mem change log.
+        self.comms_healthy = None
+
     def mode(self):
         """Get current operation mode.
 
@@ -43,12 +57,17 @@ class MachineMemory:
     def set_mode(self, mode):
         """Set operation mode.
 
+        The mode string is interned, so rule conditions comparing mem.mode()
+        against mode literals hit the string identity fast path.
+
         Args:
             mode: Operation mode string (e.g., 'READY', 'ERROR_COMMS', 'MOVING_C3_TO_C2')
         """
+        if mode is not None:
+            mode = sys.intern(mode)
         old_mode = self._state.get('_MODE')
 
-        # Only log if mode actually changed
+        # Only store and log if mode actually changed
         if old_mode != mode:
             self._state['_MODE'] = mode
 
@@ -58,9 +77,6 @@ class MachineMemory:
                     self._logger.info(f"[{mode}] Started")
                 else:
                     self._logger.info(f"[{old_mode}] -> [{mode}]")
-        else:
-            # Mode hasn't changed, just update (no-op really)
-            self._state['_MODE'] = mode
 
     def get(self, key, default=None):
         """Get arbitrary memory value.
@@ -3,7 +3,7 @@
 from .interface import ModbusInterface
 from .mock import MockModbusClient
 from .factory import create_modbus_client
-from io_mapping import MODBUS_MAP, get_address, get_info, get_all_labels
+from io_mapping import MODBUS_MAP, get_address, get_info, get_all_labels, get_read_plan, get_coil_block
 from .api import Procon
 
 # Conditionally import real client only if pymodbus is available
@@ -19,6 +19,8 @@ try:
         "get_address",
         "get_info",
         "get_all_labels",
+        "get_read_plan",
+        "get_coil_block",
     ]
 except ImportError:
     # pymodbus not installed, only mock client available
@@ -31,4 +33,6 @@ except ImportError:
         "get_address",
         "get_info",
         "get_all_labels",
+        "get_read_plan",
+        "get_coil_block",
     ]
@@ -1,10 +1,22 @@
 """High-level API for Procon Modbus operations using labels instead of addresses."""
 
 import time
-from typing import Any, Union, Optional
-from io_mapping import get_address, get_info
+from operator import itemgetter
+from typing import Any, Callable, Union, Optional
+from io_mapping import get_address, get_info, get_read_plan, get_coil_block
 from .interface import ModbusInterface
 
+# Sentinel for get(): label not in the loaded image table
+_NOT_IN_SNAPSHOT = object()
+
+
+def _tuple_getter(labels) -> Callable[[dict], tuple]:
+    """Build an itemgetter that always returns a tuple (even for one label)."""
+    if len(labels) == 1:
+        single = itemgetter(labels[0])
+        return lambda image: (single(image),)
+    return itemgetter(*labels)
+
 
 class Procon:
     """High-level wrapper for Procon Modbus operations.
@@ -47,6 +59,23 @@ class Procon:
         # set()/set_reliable() always write live to Modbus regardless.
         self._snapshot = None
 
+        # values() itemgetters, built once per labels tuple
+        self._value_getters = {}
+
+        # Last known OUTPUT coil values: updated on every successful write and
+        # on every coil readback (readback wins, it is what the hardware holds)
+        self._output_shadow = {}
+
+        # extended_hold() run tracking: label -> [value, since, last_seen], the
+        # current run of equal values in input_logs. Only labels that have been
+        # queried are tracked; new log entries are folded in incrementally.
+        self._hold_runs = {}
+        self._hold_entry = None  # Newest input log entry folded into _hold_runs
+
+        # Edge results for the loaded snapshot: (label, edge_type, window_ms) -> bool.
+        # The log walk is idempotent within a scan, so it runs once per key.
+        self._edge_cache = {}
+
     def load_snapshot(self, input_data: dict, output_data: dict) -> None:
         """Load input/output image table for this scan cycle.
 
@@ -59,6 +88,7 @@ class Procon:
             output_data: Dict of all output labels to values (from bulk read)
         """
         self._snapshot = {**input_data, **output_data}
+        self._edge_cache.clear()
 
     def clear_snapshot(self) -> None:
         """Clear the image table after rule evaluation.
@@ -68,6 +98,14 @@ class Procon:
         """
         self._snapshot = None
 
+    def get_output_shadow(self) -> dict:
+        """Get last known OUTPUT coil values without touching Modbus.
+
+        Returns:
+            dict: {label: value} for every output coil written or read back so far
+        """
+        return self._output_shadow.copy()
+
     def get(self, device_or_label: str, label: str = None) -> Union[bool, int, None]:
         """Read value by device and label, or by label only.
 
@@ -96,15 +134,13 @@ class Procon:
             >>> procon.get('VERSION')          # Works for any label
             12345
         """
-        # Resolve label from either calling convention
-        if label is None:
-            resolved_label = device_or_label
-        else:
-            resolved_label = label
-
-        # If snapshot is loaded, read from image table (PLC-style)
-        if self._snapshot is not None and resolved_label in self._snapshot:
-            return self._snapshot[resolved_label]
+        # If snapshot is loaded, read from image table (PLC-style).
+        # One dict lookup per call: this is the hot path for every rule condition.
+        snapshot = self._snapshot
+        if snapshot is not None:
+            value = snapshot.get(device_or_label if label is None else label, _NOT_IN_SNAPSHOT)
+            if value is not _NOT_IN_SNAPSHOT:
+                return value
 
         # No snapshot or label not in snapshot - fall back to live Modbus read
         if label is None:
@@ -120,6 +156,56 @@ class Procon:
         device = device_or_label
         return self._get_from_device(device, label)
 
+    def all_true(self, labels) -> bool:
+        """Check that every label reads truthy (AND of several get() calls).
+
+        With a snapshot loaded that holds every label this is one C-level pass
+        over the image table instead of a get() call per label.
+
+        Args:
+            labels: Sequence of labels (prefer a module-level tuple)
+
+        Returns:
+            True if every label reads truthy
+
+        Example:
+            >>> procon.all_true(('Auto_Select', 'E_Stop'))
+            True
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            try:
+                return all(map(snapshot.__getitem__, labels))
+            except KeyError:
+                pass  # Label not in image table - fall back to get() per label
+        return all(self.get(label) for label in labels)
+
+    def values(self, labels) -> tuple:
+        """Read several labels at once, for tuple unpacking.
+
+        With a snapshot loaded that holds every label this is one C-level
+        itemgetter call on the image table instead of a get() call per label.
+
+        Args:
+            labels: Sequence of labels (prefer a module-level tuple)
+
+        Returns:
+            tuple: Values in the same order as labels (None for failed reads)
+
+        Example:
+            >>> s1, s2 = procon.values(('S1', 'S2'))
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            getter = self._value_getters.get(labels)
+            if getter is None:
+                getter = self._value_getters[labels] = _tuple_getter(labels)
+            try:
+                return getter(snapshot)
+            except KeyError:
+                pass  # Label not in image table - fall back to get() per label
+        return tuple(self.get(label) for label in labels)
+
     def _get_from_device(self, device: str, label: str) -> Union[bool, int, None]:
         """Internal method to read from a specific device.
 
@@ -138,6 +224,19 @@ class Procon:
         if address is None:
             return None
 
+        return self.get_by_addr(device, address, reg_type)
+
+    def get_by_addr(self, device: str, address: int, reg_type: str) -> Union[bool, int, None]:
+        """Read a single value from a pre-resolved address (skips label lookup).
+
+        Args:
+            device: 'INPUT' or 'OUTPUT' (upper-case)
+            address: Modbus address, as returned by get_address()
+            reg_type: 'coils' or 'registers'
+
+        Returns:
+            bool for coils, int for registers, None if not found or error
+        """
         client = self.clients.get(device)
         slave_id = self.slave_ids.get(device)
 
@@ -169,6 +268,10 @@ class Procon:
         1. set(device, label, value) - Write to specific device
         2. set(label, value) - Search OUTPUT then INPUT automatically
 
+        Writes to an OUTPUT coil that already holds the value (per the output
+        shadow) return True without a Modbus write. Use set_reliable() for
+        commands that must always go out on the wire.
+
         Args:
             device_or_label: Device ('input'/'output') or label if called with 2 args
             label_or_value: Label if 3 args, or value if 2 args
@@ -217,6 +320,26 @@ class Procon:
         if address is None:
             return False
 
+        # Output already holds this value - skip the Modbus round-trip
+        if device == 'OUTPUT' and reg_type == 'coils':
+            info = get_info(device, address, reg_type)
+            if info and self._output_shadow.get(info['label']) is value:
+                return True
+
+        return self.set_by_addr(device, address, reg_type, value)
+
+    def set_by_addr(self, device: str, address: int, reg_type: str, value: Union[bool, int]) -> bool:
+        """Write a single value to a pre-resolved address (skips label lookup).
+
+        Args:
+            device: 'INPUT' or 'OUTPUT' (upper-case)
+            address: Modbus address, as returned by get_address()
+            reg_type: 'coils' or 'registers'
+            value: Boolean for coils, integer for registers
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
         client = self.clients.get(device)
         slave_id = self.slave_ids.get(device)
 
@@ -232,7 +355,13 @@ class Procon:
                 result = client.write_coil(address, value, device_id=slave_id)
 
                 # Check if write was successful (result should not be None)
-                return result is not None
+                if result is None:
+                    return False
+                if device == 'OUTPUT':
+                    info = get_info(device, address, reg_type)
+                    if info:
+                        self._output_shadow[info['label']] = value
+                return True
 
             elif reg_type == 'registers':
                 # Write single register
@@ -245,7 +374,8 @@ class Procon:
         except Exception:
             return False
 
-    def set_reliable(self, label: str, value: bool, retries: int = 3, delay_ms: float = 20) -> bool:
+    def set_reliable(self, label: str, value: bool, retries: int = 3, delay_ms: float = 20,
+                     address: Optional[int] = None) -> bool:
         """Write motor state multiple times with delays for critical outputs.
 
         This "triple-tap" pattern ensures motor commands get through even if
@@ -256,6 +386,8 @@ class Procon:
             value: Boolean value to write
             retries: Number of write attempts (default: 3)
             delay_ms: Delay between writes in milliseconds (default: 20)
+            address: Pre-resolved OUTPUT coil address (optional, skips the
+                label lookup on every attempt)
 
         Returns:
             bool: True if at least one write succeeded, False if all failed
@@ -268,8 +400,15 @@ class Procon:
         failures = 0
         last_error = None
 
+        # Resolve the label once rather than on every tap
+        if address is None:
+            address, _ = get_address('OUTPUT', label, 'coils')
+
         for i in range(retries):
-            success = self.set(label, value)
+            if address is not None:
+                success = self.set_by_addr('OUTPUT', address, 'coils', value)
+            else:
+                success = self.set(label, value)
             if success:
                 successes += 1
             else:
@@ -298,15 +437,102 @@ class Procon:
 
         return successes > 0
 
-    def get_all(self, device: str, reg_type: str) -> dict:
+    def set_coils_by_addr(self, device: str, address: int, values: list) -> bool:
+        """Write consecutive coils in one Modbus request (skips label lookup).
+
+        Args:
+            device: 'INPUT' or 'OUTPUT' (upper-case)
+            address: Starting coil address, as returned by get_address()
+            values: Boolean values for address, address + 1, ...
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        client = self.clients.get(device)
+        slave_id = self.slave_ids.get(device)
+
+        if not client or not all(isinstance(value, bool) for value in values):
+            return False
+
+        try:
+            result = client.write_coils(address, values, device_id=slave_id)
+        except Exception:
+            return False
+
+        # Check if write was successful (result should not be None)
+        if result is None:
+            return False
+        if device == 'OUTPUT':
+            for offset, value in enumerate(values):
+                info = get_info(device, address + offset, 'coils')
+                if info:
+                    self._output_shadow[info['label']] = value
+        return True
+
+    def set_reliable_many(self, labels, value: bool, retries: int = 3, delay_ms: float = 20) -> bool:
+        """Triple-tap the same value to several OUTPUT coils at once.
+
+        When the coils sit at consecutive addresses each tap is a single
+        write_coils request (FC15) instead of one request per coil; otherwise
+        this falls back to set_reliable() per label.
+
+        Args:
+            labels: OUTPUT coil labels (e.g., ('MOTOR_2', 'MOTOR_3'))
+            value: Boolean value to write to every coil
+            retries: Number of write attempts (default: 3)
+            delay_ms: Delay between writes in milliseconds (default: 20)
+
+        Returns:
+            bool: True if at least one write succeeded for every coil
+
+        Example:
+            >>> procon.set_reliable_many(('MOTOR_2', 'MOTOR_3'), False)  # Stop both
+            True
+        """
+        labels = tuple(labels)
+        start = get_coil_block('OUTPUT', labels)
+        if start is None:
+            # Not one contiguous block - write each coil on its own
+            return all([self.set_reliable(label, value, retries, delay_ms) for label in labels])
+
+        values = [value] * len(labels)
+        successes = 0
+        for i in range(retries):
+            if self.set_coils_by_addr('OUTPUT', start, values):
+                successes += 1
+
+            # Delay between writes (but not after the last one)
+            if i < retries - 1:
+                time.sleep(delay_ms / 1000.0)
+
+        # Log results if there were any failures
+        failures = retries - successes
+        if failures > 0 and self.log_manager:
+            label_str = ", ".join(labels)
+            if successes > 0:
+                self.log_manager.warning(
+                    f"[Motor Write] {label_str}={value}: {successes}/{retries} succeeded, "
+                    f"{failures} failed"
+                )
+            else:
+                self.log_manager.error(
+                    f"[Motor Write FAILED] {label_str}={value}: All {retries} attempts failed! "
+                    f"Motors may not have stopped/started!"
+                )
+
+        return successes > 0
+
+    def get_all(self, device: str, reg_type: str, out: Optional[dict] = None) -> dict:
         """Read all values of a specific type from a device.
 
         Args:
             device: 'input' or 'output' (case-insensitive)
             reg_type: 'coils' or 'registers'
+            out: Optional dict to write values into (e.g. to collect coils and
+                 registers in one dict without merging); a new dict if omitted
 
         Returns:
-            dict: {label: value} mapping
+            dict: {label: value} mapping (out, when given)
 
         Example:
             >>> api.get_all('input', 'coils')
@@ -318,50 +544,45 @@ class Procon:
         client = self.clients.get(device)
         slave_id = self.slave_ids.get(device)
 
-        if not client:
-            return {}
-
-        result = {}
-
-        # Get all defined addresses for this device/type
-        from io_mapping import get_all_labels
-        labels = get_all_labels(device, reg_type)
-
-        if not labels:
-            return {}
-
-        # Find min and max addresses to read in one go
-        addresses = [addr for addr, _, _ in labels]
-        min_addr = min(addresses)
-        max_addr = max(addresses)
-        count = max_addr - min_addr + 1
-
-        try:
-            if reg_type == 'coils':
-                read_result = client.read_coils(min_addr, count=count, device_id=slave_id)
-                if hasattr(read_result, 'bits'):
-                    for addr, label, _ in labels:
-                        idx = addr - min_addr
-                        if idx < len(read_result.bits):
-                            result[label] = read_result.bits[idx]
-
-            elif reg_type == 'registers':
-                read_result = client.read_holding_registers(min_addr, count=count, device_id=slave_id)
-                if hasattr(read_result, 'registers'):
-                    for addr, label, _ in labels:
-                        idx = addr - min_addr
-                        if idx < len(read_result.registers):
-                            result[label] = read_result.registers[idx]
-                else:
-                    # Connection failed - explicitly set registers to 0
-                    for addr, label, _ in labels:
-                        result[label] = 0
+        result = {} if out is None else out
 
-        except Exception:
-            # On exception, explicitly set all registers to 0 for clarity
-            if reg_type == 'registers':
-                for addr, label, _ in labels:
-                    result[label] = 0
+        if not client:
+            return result
+
+        # Read plan is built once at import - one Modbus transaction per run
+        for start, count, run_labels in get_read_plan(device, reg_type):
+            try:
+                if reg_type == 'coils':
+                    read_result = client.read_coils(start, count=count, device_id=slave_id)
+                    if hasattr(read_result, 'bits'):
+                        # Unmapped holes in the run carry a None label - drop them
+                        result.update(zip(run_labels, read_result.bits))
+                        result.pop(None, None)
+                        if device == 'OUTPUT':
+                            # Only this run's coils - result may hold other values
+                            self._output_shadow.update(zip(run_labels, read_result.bits))
+                            self._output_shadow.pop(None, None)
+                    elif device == 'OUTPUT':
+                        # Readback failed - we no longer know what the hardware holds
+                        self._output_shadow.clear()
+
+                elif reg_type == 'registers':
+                    read_result = client.read_holding_registers(start, count=count, device_id=slave_id)
+                    if hasattr(read_result, 'registers'):
+                        result.update(zip(run_labels, read_result.registers))
+                        result.pop(None, None)
+                    else:
+                        # Connection failed - explicitly set registers to 0
+                        result.update(dict.fromkeys(run_labels, 0))
+                        result.pop(None, None)
+
+            except Exception:
+                if reg_type == 'coils' and device == 'OUTPUT':
+                    self._output_shadow.clear()
+                # On exception, explicitly set all registers to 0 for clarity
+                if reg_type == 'registers':
+                    result.update(dict.fromkeys(run_labels, 0))
+                    result.pop(None, None)
 
         return result
 
@@ -423,39 +644,105 @@ class Procon:
         if len(logs) < 2:
             return False
 
-        # Calculate time window
-        current_time = time.time()
-        cutoff_time = current_time - hold_seconds
-
-        # Collect all values within the hold window
-        values_in_window = []
-        for entry in reversed(logs):
-            if entry.timestamp < cutoff_time:
-                break
-            values_in_window.append((entry.timestamp, entry.data.get(label)))
-
-        # Need enough history to cover the hold period
-        if not values_in_window:
+        # O(1) per call: compare against the tracked run instead of walking the window
+        self._sync_hold_runs(logs)
+        run = self._hold_runs.get(label)
+        if run is None:
+            run = self._hold_runs[label] = self._seed_hold_run(label, logs)
+        run_value, since, last_seen = run
+        if run_value != value:
             return False
 
-        # Check if we have data covering the entire hold period
+        cutoff_time = time.time() - hold_seconds
+
+        # Need a sample inside the hold period (stale logs mean no data, not a hold),
+        # and the run must cover the entire hold period.
         # Allow a small tolerance (10% of hold time) for timing precision
-        oldest_timestamp = values_in_window[-1][0]
         tolerance = hold_seconds * 0.1
-        if oldest_timestamp > (cutoff_time + tolerance):
-            # Not enough history - can't confirm hold
-            return False
+        return last_seen >= cutoff_time and since <= (cutoff_time + tolerance)
+
+    def _seed_hold_run(self, label: str, logs) -> list:
+        """Build the current run for a newly tracked label from input_logs.
+
+        Args:
+            label: Signal label
+            logs: input_logs deque (not empty)
+
+        Returns:
+            list: [value, since, last_seen] - newest value, timestamp of the first
+                  entry of its run and timestamp of the newest entry
+        """
+        newest = logs[-1]
+        value = newest.data.get(label)
+        since = newest.timestamp
+        for entry in reversed(logs):
+            if entry.data.get(label) != value:
+                break
+            since = entry.timestamp
+        return [value, since, newest.timestamp]
+
+    def _sync_hold_runs(self, logs) -> None:
+        """Fold input log entries added since the last call into _hold_runs.
 
-        # Check that ALL values in the window match the desired value
-        for timestamp, signal_value in values_in_window:
-            if signal_value != value:
-                return False  # Found a different value - not held continuously
+        Args:
+            logs: input_logs deque (not empty)
+        """
+        newest = logs[-1]
+        if newest is self._hold_entry:
+            return
 
-        return True  # All values match - signal has been held
+        # Collect new entries back to the last folded one (usually just one)
+        new_entries = []
+        for entry in reversed(logs):
+            if entry is self._hold_entry:
+                break
+            new_entries.append(entry)
+        else:
+            # Last folded entry is gone (first call, or logs trimmed) - reseed
+            self._hold_entry = newest
+            for label in self._hold_runs:
+                self._hold_runs[label] = self._seed_hold_run(label, logs)
+            return
+
+        for entry in reversed(new_entries):
+            timestamp = entry.timestamp
+            data = entry.data
+            for label, run in self._hold_runs.items():
+                value = data.get(label)
+                if value == run[0]:
+                    run[2] = timestamp
+                else:
+                    run[0] = value
+                    run[1] = timestamp
+                    run[2] = timestamp
+        self._hold_entry = newest
 
     def _detect_edge(self, label: str, edge_type: str, window_ms: float) -> bool:
         """Internal method to detect edges in log history.
 
+        While a snapshot is loaded the result is cached for the rest of the scan,
+        so rules checking the same edge share one walk of the logs.
+
+        Args:
+            label: Signal label
+            edge_type: 'rising' or 'falling'
+            window_ms: Time window in milliseconds
+
+        Returns:
+            True if edge detected within window
+        """
+        if self._snapshot is None:
+            return self._scan_edge(label, edge_type, window_ms)
+
+        key = (label, edge_type, window_ms)
+        edge = self._edge_cache.get(key)
+        if edge is None:
+            edge = self._edge_cache[key] = self._scan_edge(label, edge_type, window_ms)
+        return edge
+
+    def _scan_edge(self, label: str, edge_type: str, window_ms: float) -> bool:
+        """Walk input_logs for an edge within the window (uncached).
+
         Args:
             label: Signal label
             edge_type: 'rising' or 'falling'
@@ -474,29 +761,25 @@ class Procon:
         window_seconds = window_ms / 1000.0
         cutoff_time = current_time - window_seconds
 
-        # Collect values within the time window (iterate backwards from newest)
-        values_in_window = []
+        # (before, after) values that make up the requested transition
+        if edge_type == 'rising':
+            before, after = False, True
+        elif edge_type == 'falling':
+            before, after = True, False
+        else:
+            return False
+
+        # Walk back from the newest entry comparing each value with the one
+        # logged after it - stops at the first matching transition
+        newer_val = None
+        have_newer = False
         for entry in reversed(logs):
             if entry.timestamp < cutoff_time:
                 break
-            values_in_window.append((entry.timestamp, entry.data.get(label)))
-
-        if len(values_in_window) < 2:
-            return False
-
-        # Reverse to get chronological order (oldest first)
-        values_in_window.reverse()
-
-        # Look for the specified edge transition
-        for i in range(len(values_in_window) - 1):
-            current_val = values_in_window[i][1]
-            next_val = values_in_window[i + 1][1]
-
-            if edge_type == 'rising':
-                if current_val == False and next_val == True:
-                    return True
-            elif edge_type == 'falling':
-                if current_val == True and next_val == False:
-                    return True
+            current_val = entry.data.get(label)
+            if have_newer and current_val == before and newer_val == after:
+                return True
+            newer_val = current_val
+            have_newer = True
 
         return False
@@ -1,5 +1,6 @@
 """Real PyModbus client implementation."""
 
+import socket
 from typing import Any
 from pymodbus.client import ModbusTcpClient
 from pymodbus.exceptions import ModbusException, ConnectionException
@@ -33,6 +34,7 @@ class ModbusClient(ModbusInterface):
             timeout=timeout,
             retries=retries
         )
+        self._tuned_socket = None  # Socket object TCP_NODELAY was last applied to
 
     def connect(self) -> bool:
         """Establish connection to Modbus device.
@@ -41,11 +43,40 @@ class ModbusClient(ModbusInterface):
             bool: True if connection successful, False otherwise
         """
         try:
-            return self._client.connect()
+            connected = self._client.connect()
         except (ConnectionException, OSError, TimeoutError):
             # Network error during connection attempt
             return False
 
+        if connected:
+            self._set_nodelay()
+        return connected
+
+    def _set_nodelay(self) -> None:
+        """Disable Nagle's algorithm on the underlying TCP socket.
+
+        Modbus requests are tiny request/response pairs; with Nagle enabled
+        the kernel can hold each PDU back waiting for a delayed ACK.
+        """
+        sock = getattr(self._client, 'socket', None)
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._tuned_socket = sock
+        except (OSError, AttributeError):
+            # Socket already closed or not a TCP socket - nothing to tune
+            pass
+
+    def _ensure_nodelay(self) -> None:
+        """Re-apply TCP_NODELAY if pymodbus has opened a new socket.
+
+        pymodbus reconnects on its own when a request finds the socket closed,
+        bypassing connect() above - check the socket identity before each request.
+        """
+        if getattr(self._client, 'socket', None) is not self._tuned_socket:
+            self._set_nodelay()
+
     def close(self) -> None:
         """Close connection to Modbus device."""
         try:
@@ -74,6 +105,7 @@ class ModbusClient(ModbusInterface):
             Response object with .bits attribute containing bool values, or None on error
         """
         try:
+            self._ensure_nodelay()
             return self._client.read_coils(address, count=count, device_id=device_id)
         except (ModbusException, ConnectionException, OSError, TimeoutError):
             # Network disconnection, timeout, or other communication error
@@ -91,11 +123,30 @@ class ModbusClient(ModbusInterface):
             Response object, or None on error
         """
         try:
+            self._ensure_nodelay()
             return self._client.write_coil(address, value, device_id=device_id)
         except (ModbusException, ConnectionException, OSError, TimeoutError):
             # Network disconnection, timeout, or other communication error
             return None
 
+    def write_coils(self, address: int, values: list, device_id: int = 1) -> Any:
+        """Write consecutive coils to Modbus device in one request (FC15).
+
+        Args:
+            address: Starting coil address
+            values: Boolean values for address, address + 1, ...
+            device_id: Modbus device/slave ID
+
+        Returns:
+            Response object, or None on error
+        """
+        try:
+            self._ensure_nodelay()
+            return self._client.write_coils(address, values, device_id=device_id)
+        except (ModbusException, ConnectionException, OSError, TimeoutError):
+            # Network disconnection, timeout, or other communication error
+            return None
+
     def read_holding_registers(self, address: int, count: int = 1, device_id: int = 1) -> Any:
         """Read holding registers from Modbus device.
 
@@ -108,6 +159,7 @@ class ModbusClient(ModbusInterface):
             Response object with .registers attribute containing int values, or None on error
         """
         try:
+            self._ensure_nodelay()
             return self._client.read_holding_registers(address, count=count, device_id=device_id)
         except (ModbusException, ConnectionException, OSError, TimeoutError):
             # Network disconnection, timeout, or other communication error
@@ -125,6 +177,7 @@ class ModbusClient(ModbusInterface):
             Response object with .registers attribute containing int values, or None on error
         """
         try:
+            self._ensure_nodelay()
             return self._client.read_input_registers(address, count=count, device_id=device_id)
         except (ModbusException, ConnectionException, OSError, TimeoutError):
             # Network disconnection, timeout, or other communication error
@@ -142,6 +195,7 @@ class ModbusClient(ModbusInterface):
             Response object, or None on error
         """
         try:
+            self._ensure_nodelay()
             return self._client.write_register(address, value, device_id=device_id)
         except (ModbusException, ConnectionException, OSError, TimeoutError):
             # Network disconnection, timeout, or other communication error
@@ -58,6 +58,20 @@ class ModbusInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def write_coils(self, address: int, values: list, device_id: int = 1) -> Any:
+        """Write consecutive coils to Modbus device in one request (FC15).
+
+        Args:
+            address: Starting coil address
+            values: Boolean values for address, address + 1, ...
+            device_id: Modbus device/slave ID
+
+        Returns:
+            Response object
+        """
+        pass
+
     @abstractmethod
     def read_holding_registers(self, address: int, count: int = 1, device_id: int = 1) -> Any:
         """Read holding registers from Modbus device.
@@ -95,12 +95,16 @@ class MockModbusClient(ModbusInterface):
         bits = []
         for i in range(count):
             addr = address + i
+            # Coils that have been written read back as written
+            if addr in self._coils:
+                bits.append(self._coils[addr])
+                continue
             # Convert 0-indexed address to 1-indexed for inputs dict
             input_idx = addr + 1
             if input_idx in self.inputs:
                 bits.append(self.inputs[input_idx]['state'])
             else:
-                bits.append(self._coils.get(addr, False))
+                bits.append(False)
         return MockResponse(bits=bits, address=address)
 
     def write_coil(self, address: int, value: bool, device_id: int = 1) -> MockResponse:
@@ -117,6 +121,21 @@ class MockModbusClient(ModbusInterface):
         self._coils[address] = value
         return MockResponse(address=address, value=value)
 
+    def write_coils(self, address: int, values: list, device_id: int = 1) -> MockResponse:
+        """Write consecutive coils to mock memory.
+
+        Args:
+            address: Starting coil address
+            values: Boolean values for address, address + 1, ...
+            device_id: Modbus device/slave ID (ignored in mock)
+
+        Returns:
+            MockResponse
+        """
+        for offset, value in enumerate(values):
+            self._coils[address + offset] = value
+        return MockResponse(address=address, value=list(values))
+
     def read_holding_registers(self, address: int, count: int = 1, device_id: int = 1) -> MockResponse:
         """Read holding registers from mock memory.
 
@@ -9,12 +9,22 @@ from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 
 
+# Poll-loop timing thresholds (monotonic nanoseconds)
+SLOW_READ_NS = 500_000_000   # Modbus read of all I/O
+SLOW_RULES_NS = 400_000_000  # One rule-engine scan
+SLOW_LOOP_NS = 1_000_000_000  # Whole poll cycle (indicates blocking)
+
+
 @dataclass
 class SystemState:
     """Thread-safe shared state between polling thread and UI.
 
     This class holds all system data that needs to be shared between
     the background polling thread and the UI thread.
+
+    The polling thread updates the fields under the lock and then calls
+    publish(), which swaps in a new snapshot dict. Readers take that
+    reference with get_snapshot() - no lock, no copy.
     """
     # Data from Modbus devices
     input_data: Dict[str, Any] = field(default_factory=dict)
@@ -35,6 +45,12 @@ class SystemState:
     input_heartbeat: int = 0
     output_heartbeat: int = 0
 
+    # Last published snapshot (replaced wholesale, never mutated)
+    _published: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        self.publish()
+
     def update_from_poll(self, input_data: Dict[str, Any], output_data: Dict[str, Any]) -> None:
         """Update state from polling thread (must be called with lock held)."""
         self.input_data = input_data.copy()
@@ -43,26 +59,42 @@ class SystemState:
         self.output_heartbeat += 1
 
     def update_rule_state(self, rule_state: Dict[str, Any], active_rules: list) -> None:
-        """Update rule engine state (must be called with lock held)."""
-        self.rule_state = rule_state.copy()
-        self.active_rules = active_rules.copy()
+        """Update rule engine state (must be called with lock held).
+
+        Takes ownership of both arguments: pass fresh copies, as
+        RuleEngine.get_state() and get_active_rules() return.
+        """
+        self.rule_state = rule_state
+        self.active_rules = active_rules
         # Derive error comms mode from mode
         mode = rule_state.get('_MODE')
         self.in_error_comms_mode = mode in ('ERROR_COMMS', 'ERROR_COMMS_ACK')
 
+    def publish(self) -> None:
+        """Publish the current fields as the new snapshot (call with lock held).
+
+        The update methods always replace input_data, output_data, rule_state
+        and active_rules with fresh copies, so the snapshot can reference them
+        directly. Assigning _published is a single atomic reference swap.
+        """
+        self._published = {
+            'input_data': self.input_data,
+            'output_data': self.output_data,
+            'in_error_comms_mode': self.in_error_comms_mode,
+            'connected': self.connected,
+            'rule_state': self.rule_state,
+            'active_rules': self.active_rules,
+            'input_heartbeat': self.input_heartbeat,
+            'output_heartbeat': self.output_heartbeat,
+        }
+
     def get_snapshot(self) -> dict:
-        """Get a thread-safe snapshot of all state."""
-        with self.lock:
-            return {
-                'input_data': self.input_data.copy(),
-                'output_data': self.output_data.copy(),
-                'in_error_comms_mode': self.in_error_comms_mode,
-                'connected': self.connected,
-                'rule_state': self.rule_state.copy(),
-                'active_rules': self.active_rules.copy(),
-                'input_heartbeat': self.input_heartbeat,
-                'output_heartbeat': self.output_heartbeat,
-            }
+        """Get the last published snapshot of all state.
+
+        Lock-free: returns the published dict itself, which is shared between
+        readers and must be treated as read-only.
+        """
+        return self._published
 
 
 class PollingThread(threading.Thread):
@@ -86,6 +118,7 @@ class PollingThread(threading.Thread):
         self.rule_engine = rule_engine
         self.state = state
         self.poll_interval = poll_interval
+        self._poll_interval_ns = int(poll_interval * 1_000_000_000)
         self._stop_event = threading.Event()
         self._rotation_counter = 0  # Counter for periodic log rotation
 
@@ -98,61 +131,53 @@ class PollingThread(threading.Thread):
         self.controller.log_manager.debug("Polling thread started")
 
         while not self._stop_event.is_set():
-            loop_start = time.time()
+            loop_start = time.monotonic_ns()
 
             try:
-                # Check if we should skip reads due to comms failure
-                should_read = True
+                # Comms failure only changes how read errors are reported - reads
+                # continue so the comms health check sees the VERSION heartbeat return
                 with self.state.lock:
                     in_error_comms_mode = self.state.in_error_comms_mode
 
-                if in_error_comms_mode:
-                    # Communications have failed - SKIP all reads until operator acknowledges
-                    # Operator must cycle the auto_start switch (off then on) to reset COMMS_FAILED
-                    should_read = False
-
                 # Perform blocking I/O (outside the lock!)
                 # Always wrap in try/except to handle broken connections gracefully
                 try:
-                    read_start = time.time()
-                    if should_read:
-                        input_data = self.controller.read_and_log_all_inputs()
-                        output_data = self.controller.read_and_log_all_outputs()
-                    else:
-                        # During comms failure, keep trying to read inputs to detect recovery
-                        # This allows comms health check to see when VERSION heartbeat returns
-                        input_data = self.controller.read_and_log_all_inputs()
-                        output_data = self.controller.read_and_log_all_outputs()
-                    read_elapsed_ms = (time.time() - read_start) * 1000
+                    read_start = time.monotonic_ns()
+                    # One submission per cycle: inputs and outputs in flight together
+                    input_data, output_data = self.controller.read_and_log_all_io()
+                    read_elapsed_ns = time.monotonic_ns() - read_start
                     # Log warning if read takes longer than 500ms
-                    if read_elapsed_ms > 500:
-                        self.controller.log_manager.warning(f"[TIMING] Slow Modbus read: {read_elapsed_ms:.0f}ms")
+                    if read_elapsed_ns > SLOW_READ_NS:
+                        self.controller.log_manager.warning("[TIMING] Slow Modbus read: %dms", read_elapsed_ns // 1_000_000)
                 except Exception as e:
-                    read_elapsed_ms = (time.time() - read_start) * 1000
+                    read_elapsed_ns = time.monotonic_ns() - read_start
                     # Read failed - will keep retrying next cycle
                     if in_error_comms_mode:
-                        self.controller.log_manager.debug(f"Read failed during ERROR_COMMS (will retry): {e}")
+                        self.controller.log_manager.debug("Read failed during ERROR_COMMS (will retry): %s", e)
                     else:
-                        self.controller.log_manager.error(f"[TIMING] Read failed after {read_elapsed_ms:.0f}ms: {e}")
+                        self.controller.log_manager.error("[TIMING] Read failed after %dms: %s", read_elapsed_ns // 1_000_000, e)
                     input_data = {}
                     output_data = {}
 
                 # Log I/O changes FIRST (smart logging - only logs when values change)
                 # This shows the CAUSE before the EFFECT (rule actions)
                 # Skip logging in MANUAL mode - no need to track I/O changes during manual operation
-                if input_data or output_data:
-                    current_mode = self.rule_engine.get_state().get('_MODE') if self.rule_engine else None
+                # Combined I/O for this scan, built once for the change log and the rules
+                sensor_data = {**input_data, **output_data}
+                if sensor_data:
+                    current_mode = self.rule_engine.mem.mode() if self.rule_engine else None
                     if current_mode != 'MANUAL':
-                        io_combined = {**input_data, **output_data}
-                        self.controller.log_manager.log_io_changes(io_combined)
+                        self.controller.log_manager.log_io_changes(sensor_data)
 
                 # THEN evaluate rules (which may react to I/O changes)
                 # PLC-STYLE SCAN: Load image table before rules, clear after.
                 # During rule evaluation, procon.get() reads from this frozen snapshot.
-                # procon.set()/set_reliable() still write live to Modbus.
+                # procon.set()/set_reliable() still write live to Modbus - outputs are not
+                # buffered to the end of the scan, so a safety stop goes out in the rung
+                # that issues it. Steady-state scans write nothing: set() skips coils the
+                # output shadow already holds and both motors stop in one block write.
                 if self.rule_engine:
-                    rules_start = time.time()
-                    sensor_data = {**input_data, **output_data}
+                    rules_start = time.monotonic_ns()
                     # Load input/output image table (like PLC input scan)
                     self.controller.procon.load_snapshot(input_data, output_data)
                     try:
@@ -160,10 +185,10 @@ class PollingThread(threading.Thread):
                     finally:
                         # Clear image table (like PLC output scan complete)
                         self.controller.procon.clear_snapshot()
-                    rules_elapsed_ms = (time.time() - rules_start) * 1000
+                    rules_elapsed_ns = time.monotonic_ns() - rules_start
                     # Log warning if rule evaluation takes longer than 400ms
-                    if rules_elapsed_ms > 400:
-                        self.controller.log_manager.warning(f"[TIMING] Slow rule evaluation: {rules_elapsed_ms:.0f}ms")
+                    if rules_elapsed_ns > SLOW_RULES_NS:
+                        self.controller.log_manager.warning("[TIMING] Slow rule evaluation: %dms", rules_elapsed_ns // 1_000_000)
 
                 # Update shared state (quick operation with lock)
                 with self.state.lock:
@@ -172,23 +197,25 @@ class PollingThread(threading.Thread):
                         self.state.update_from_poll(input_data, output_data)
 
                     if self.rule_engine:
+                        # One copy of memory per tick, shared by the state update and the change log
+                        rule_state = self.rule_engine.get_state()
                         self.state.update_rule_state(
-                            self.rule_engine.get_state(),
+                            rule_state,
                             self.rule_engine.get_active_rules()
                         )
                         # Log memory state changes (smart logging) - skip in MANUAL mode
-                        current_mode = self.rule_engine.get_state().get('_MODE')
-                        if current_mode != 'MANUAL':
-                            self.controller.log_manager.log_mem_changes(
-                                self.rule_engine.get_state()
-                            )
+                        if rule_state.get('_MODE') != 'MANUAL':
+                            self.controller.log_manager.log_mem_changes(rule_state)
                     else:
                         # Fallback: use controller's comms check
                         self.controller.check_and_handle_comms_failure()
                         self.state.comms_failed = self.controller.comms_dead
 
+                    # Make this tick visible to readers in one reference swap
+                    self.state.publish()
+
             except Exception as e:
-                self.controller.log_manager.error(f"Polling thread error: {e}")
+                self.controller.log_manager.error("Polling thread error: %s", e)
 
             # Clean up old log entries periodically (every ~1000 loops to avoid excessive file I/O)
             self._rotation_counter += 1
@@ -197,12 +224,12 @@ class PollingThread(threading.Thread):
                 self._rotation_counter = 0
 
             # Sleep for remainder of poll interval
-            elapsed = time.time() - loop_start
+            elapsed_ns = time.monotonic_ns() - loop_start
             # Log warning if loop takes longer than 1 second (indicates blocking)
-            if elapsed > 1.0:
-                self.controller.log_manager.warning(f"[TIMING] Slow poll loop: {elapsed*1000:.0f}ms")
-            sleep_time = max(0, self.poll_interval - elapsed)
-            if sleep_time > 0:
-                self._stop_event.wait(sleep_time)
+            if elapsed_ns > SLOW_LOOP_NS:
+                self.controller.log_manager.warning("[TIMING] Slow poll loop: %dms", elapsed_ns // 1_000_000)
+            sleep_ns = self._poll_interval_ns - elapsed_ns
+            if sleep_ns > 0:
+                self._stop_event.wait(sleep_ns / 1_000_000_000)
 
         self.controller.log_manager.debug("Polling thread stopped")
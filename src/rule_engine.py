@@ -8,6 +8,7 @@ Rules can:
 """
 
 import time
+from bisect import bisect_right
 from typing import Callable, Dict, Any, Optional
 from src.mem import MachineMemory
 
@@ -19,8 +20,7 @@ class Rule:
 
     Example:
         class ReadyRule(Rule):
-            def __init__(self):
-                super().__init__("System Ready Check")
+            NAME = "System Ready Check"
 
             def condition(self, procon, mem):
                 return procon.get('S1') and not procon.get('S2')
@@ -29,8 +29,7 @@ class Rule:
                 mem.set_mode('READY')  # Just set state, no motor action
 
         class StartConveyorRule(Rule):
-            def __init__(self):
-                super().__init__("Start Conveyor")
+            NAME = "Start Conveyor"
 
             def condition(self, procon, mem):
                 # Compose logic: check mode and sensor
@@ -39,15 +38,46 @@ class Rule:
             def action(self, controller, procon, mem):
                 procon.set('MOTOR_2', True)
                 mem.set_mode('MOVING')
+
+    MODE GATE:
+    Set MODES to the operation modes a rule can possibly fire in and the engine
+    skips it without calling condition() in any other mode. The gate is checked
+    against the live mode at the rule's rung, so mode changes made earlier in
+    the same scan are still seen. None (default) means any mode. The gates are
+    cached per mode once rules are added, and only action() may change the mode.
+
+    For rules that can fire in almost every mode, set SKIP_MODES to the modes
+    they can never fire in instead. A rule must pass both gates.
+
+    The mode is the only dependency the engine skips rules on. Conditions may
+    read the clock (mem deadlines, procon.extended_hold) and mem, so a rule
+    admitted by its gates is evaluated every scan even if no input changed.
+
+    ALWAYS-ON RULES:
+    A rule whose action runs on every scan (in the modes it is gated to) can
+    set condition = None as a class attribute; the engine then skips the call.
     """
 
-    def __init__(self, name: str):
+    # Per-instance attributes. Subclasses declare their own __slots__ (() if
+    # they add none) so rule instances carry no __dict__.
+    __slots__ = ('name', 'enabled', 'last_triggered', 'trigger_count')
+
+    # Human-readable rule name (None = use the class name)
+    NAME: Optional[str] = None
+
+    # Operation modes this rule can fire in (None = any mode)
+    MODES: Optional[frozenset] = None
+
+    # Operation modes this rule can never fire in (checked after MODES)
+    SKIP_MODES: frozenset = frozenset()
+
+    def __init__(self, name: Optional[str] = None):
         """Initialize rule.
 
         Args:
-            name: Human-readable name for this rule
+            name: Human-readable name for this rule (default: NAME, or the class name)
         """
-        self.name = name
+        self.name = name or self.NAME or type(self).__name__
         self.enabled = True
         self.last_triggered: Optional[float] = None
         self.trigger_count = 0
@@ -68,7 +98,8 @@ class Rule:
         """Return condition details for DEBUG logging.
         
         Override this in subclasses to provide meaningful condition breakdowns.
-        Called only when the rule's condition() returns True.
+        Called only when the rule's condition() returns True and DEBUG
+        logging is enabled (log_manager.debug_mode).
         
         Args:
             procon: Procon API for reading I/O
@@ -124,6 +155,13 @@ class RuleEngine:
         self.rules: list[Rule] = []
         self.active_rules: list[str] = []  # Cleared each scan, memory is NOT
 
+        # Enabled rules in ladder order with their bound methods resolved once:
+        # (rule, condition, get_conditions, action). Rebuilt by _compile().
+        self._chain: tuple = ()
+
+        # Per-mode views of _chain, built on first use: mode -> (rung indexes, entries)
+        self._mode_chains: Dict[Any, tuple] = {}
+
     def add_rule(self, rule: Rule) -> None:
         """Add a rule to the engine.
 
@@ -134,8 +172,46 @@ class RuleEngine:
             rule: Rule instance to add
         """
         self.rules.append(rule)
+        self._compile()
         self.controller.log_manager.debug(f"Added rule: {rule.name}")
 
+    def _compile(self) -> None:
+        """Rebuild the scan chain from self.rules.
+
+        Called whenever rules are added, enabled or disabled, so evaluate()
+        does no enabled checks or method lookups per rung.
+        """
+        self._chain = tuple(
+            (rule, rule.condition, rule.get_conditions, rule.action)
+            for rule in self.rules
+            if rule.enabled
+        )
+        self._mode_chains = {}
+
+    def _chain_for_mode(self, mode) -> tuple:
+        """Get the rungs of _chain whose MODES/SKIP_MODES gates admit mode.
+
+        Args:
+            mode: Operation mode (mem.mode())
+
+        Returns:
+            tuple: (indexes, entries) - rung positions in _chain and their entries,
+                   both in ladder order
+        """
+        mode_chain = self._mode_chains.get(mode)
+        if mode_chain is None:
+            rungs = [
+                (index, entry) for index, entry in enumerate(self._chain)
+                if (entry[0].MODES is None or mode in entry[0].MODES)
+                and mode not in entry[0].SKIP_MODES
+            ]
+            mode_chain = (
+                tuple(index for index, _ in rungs),
+                tuple(entry for _, entry in rungs),
+            )
+            self._mode_chains[mode] = mode_chain
+        return mode_chain
+
     def evaluate(self, sensor_data: Dict[str, Any]) -> None:
         """Evaluate all rules sequentially (ladder logic style).
 
@@ -155,35 +231,62 @@ class RuleEngine:
             sensor_data: Current sensor/register readings (used to update logs)
         """
         # Clear active rules list (NOT memory - memory persists!)
-        self.active_rules.clear()
+        active_rules = self.active_rules
+        active_rules.clear()
 
         # Get procon instance from controller (already has edge detection)
-        procon = self.controller.procon
-
-        # Execute ALL rules in order (like PLC ladder rungs)
-        for rule in self.rules:
-            if not rule.enabled:
-                continue
+        controller = self.controller
+        procon = controller.procon
+        log_manager = controller.log_manager
+
+        # Execute ALL enabled rules in order (like PLC ladder rungs).
+        # Mode gate: only walk the rungs whose MODES admit the current mode.
+        # Only actions change the mode, so after a rung fires the walk switches
+        # to the new mode's rungs, continuing after this rung's position.
+        mem = self.mem
+        # One clock read per scan - deadline conditions compare against mem.scan_time
+        now = mem.scan_time = time.time()
+        # Per-scan results are recomputed by their rungs - none carry over
+        mem.comms_healthy = None
+        mode = mem.mode()
+        indexes, entries = self._chain_for_mode(mode)
+        count = len(entries)
+        pos = 0
+        while pos < count:
+            rule, condition, get_conditions, action = entries[pos]
+            fired = False
 
             try:
                 # Check if rule should trigger (like ladder contacts)
-                if rule.condition(procon, self.mem):
-                    self.active_rules.append(rule.name)
-                    rule.last_triggered = time.time()
+                if condition is None or condition(procon, mem):
+                    fired = True
+                    active_rules.append(rule.name)
+                    rule.last_triggered = now
                     rule.trigger_count += 1
 
-                    conditions = rule.get_conditions(procon, self.mem)
-                    if conditions:
-                        self.controller.log_manager.debug_rule(
-                            rule_name=rule.name,
-                            conditions=conditions
-                        )
+                    # Condition breakdowns only go to the DEBUG log - skip them when it is off
+                    if log_manager.debug_mode:
+                        conditions = get_conditions(procon, mem)
+                        if conditions:
+                            log_manager.debug_rule(
+                                rule_name=rule.name,
+                                conditions=conditions
+                            )
 
                     # Execute rule action (like ladder coil)
-                    rule.action(self.controller, procon, self.mem)
+                    action(controller, procon, mem)
 
             except Exception as e:
-                self.controller.log_manager.error(f"Error in rule '{rule.name}': {e}")
+                log_manager.error(f"Error in rule '{rule.name}': {e}")
+
+            if fired and mem.mode() != mode:
+                mode = mem.mode()
+                rung = indexes[pos]
+                indexes, entries = self._chain_for_mode(mode)
+                count = len(entries)
+                pos = bisect_right(indexes, rung)
+            else:
+                pos += 1
 
     def get_active_rules(self) -> list[str]:
         """Get list of currently triggered rule names.
@@ -216,8 +319,7 @@ class RuleEngine:
         IMPORTANT: Memory is NOT cleared automatically each scan!
         Memory only clears when:
         1. This method is called explicitly
-        2. Emergency stop rule calls mem.clear()
-        3. Manual intervention via API
+        2. Manual intervention via API
 
         Otherwise memory persists indefinitely across all scans.
         """
@@ -232,6 +334,7 @@ class RuleEngine:
         for rule in self.rules:
             if rule.name == rule_name:
                 rule.enabled = True
+                self._compile()
                 self.controller.log_manager.debug(f"Enabled rule: {rule_name}")
                 return
 
@@ -244,6 +347,7 @@ class RuleEngine:
         for rule in self.rules:
             if rule.name == rule_name:
                 rule.enabled = False
+                self._compile()
                 self.controller.log_manager.debug(f"Disabled rule: {rule_name}")
                 return
 
@@ -231,7 +231,7 @@ def simulate_motor_trip(delay: float):
     # Motor 1 trips (active low - False means tripped)
     set_input('M1_Trip', False, delay)
     print("  M1 TRIPPED - waiting...")
-    # Hold long enough to satisfy 1s debounce in ClearReadyRule
+    # Hold long enough to satisfy 1s debounce in SafetyModeRule
     time.sleep(max(delay * 5, SAFETY_HOLD_SECONDS))
 
     # Clear the trip